@@ -0,0 +1,27 @@
+"""
+프로세스 전역 ChromaDB 클라이언트/컬렉션 캐시
+
+PersistentClient 생성은 SQLite 연결, 스키마 확인, 파일 잠금을 거치므로
+같은 경로를 여러 번 여는 스크립트/라이브러리 호출에서 한 번만 열어 재사용합니다.
+"""
+import functools
+
+import chromadb
+from chromadb.config import Settings
+
+from app.core.Agents.Poi.VectorDB.VectorSearchAgent import DEFAULT_PERSIST_DIR
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(path: str = DEFAULT_PERSIST_DIR):
+    """경로별 PersistentClient (같은 경로는 같은 인스턴스)"""
+    return chromadb.PersistentClient(
+        path=path,
+        settings=Settings(anonymized_telemetry=False),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def get_collection(name: str, path: str = DEFAULT_PERSIST_DIR):
+    """경로/이름별 컬렉션 핸들 (없으면 chromadb 예외가 그대로 전파되고 캐시되지 않음)"""
+    return get_client(path).get_collection(name)
@@ -45,11 +45,11 @@ class EmbeddingPipeline(BaseEmbeddingPipeline):
             task_type: QUERY 또는 DOCUMENT
 
         Returns:
-            임베딩 벡터 리스트
+            L2 정규화된 임베딩 벡터 리스트 (내적 = 코사인 유사도)
         """
         if self._model is None:
             self.load_model()
-        return self._model.encode(texts).tolist()
+        return self._model.encode(texts, normalize_embeddings=True).tolist()
 
     async def embed_query(self, query: str) -> List[float]:
         """
@@ -45,14 +45,14 @@ class PersonaEmbeddingPipeline(BaseEmbeddingPipeline):
             task_type: QUERY 또는 DOCUMENT
 
         Returns:
-            임베딩 벡터 리스트
+            L2 정규화된 임베딩 벡터 리스트 (내적 = 코사인 유사도)
         """
         if not texts:
             return []
         prefix = self._task_prefixes.get(task_type.value, "")
         if prefix:
             texts = [f"{prefix}{t}" for t in texts]
-        return self._model.encode(texts).tolist()
+        return self._model.encode(texts, normalize_embeddings=True).tolist()
 
     # ─────────────────────────────────────────────────────────────
     # 쿼리 임베딩 (페르소나 직접 사용)
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 import asyncio
 import json
 import os
@@ -25,6 +25,14 @@ DEFAULT_PERSIST_DIR = os.path.join(
     "data", "vector_db"
 )
 
+# collection.get(ids=...) 1회당 최대 ID 수 (SQLite 바인딩 변수 한도 999 이하로 유지)
+EXISTING_ID_CHUNK_SIZE = 500
+
+
+def _chunked(seq: Sequence, size: int) -> Iterator[Sequence]:
+    """시퀀스를 size 크기의 조각으로 분할"""
+    return (seq[i:i + size] for i in range(0, len(seq), size))
+
 
 class VectorSearchAgent(BaseVectorSearchAgent):
     """
@@ -80,10 +88,12 @@ class VectorSearchAgent(BaseVectorSearchAgent):
                         )
                     )
 
+                # 임베딩은 삽입 시점에 L2 정규화되므로 내적(ip)으로 검색
+                # (기존 cosine 컬렉션은 생성 시 설정이 유지됨)
                 self._collection = await asyncio.to_thread(
                     lambda: self._client.get_or_create_collection(
                         name=self.collection_name,
-                        metadata={"hnsw:space": "cosine"}
+                        metadata={"hnsw:space": "ip"}
                     )
                 )
                 self._initialized = True
@@ -124,7 +134,8 @@ class VectorSearchAgent(BaseVectorSearchAgent):
                 document = results.get("documents", [[]])[0][i] if results.get("documents") else ""
                 distance = results.get("distances", [[]])[0][i] if results.get("distances") else 1.0
 
-                # cosine distance를 similarity score로 변환
+                # distance를 similarity score로 변환
+                # (ip: 1 - dot, cosine: 1 - cos 이므로 정규화된 벡터에서는 동일)
                 similarity = 1 - distance
 
                 result = PoiSearchResult(
@@ -174,6 +185,15 @@ class VectorSearchAgent(BaseVectorSearchAgent):
             logger.error(f"Vector text search error: {e}")
             return []
 
+    def _get_existing_ids(self, ids: List[str]) -> set:
+        """컬렉션에 이미 존재하는 ID 집합 조회 (청크 단위 get으로 파라미터 한도 회피)"""
+        existing_ids: set = set()
+        for chunk in _chunked(ids, EXISTING_ID_CHUNK_SIZE):
+            existing = self._collection.get(ids=list(chunk), include=[])
+            if existing and existing.get("ids"):
+                existing_ids.update(existing["ids"])
+        return existing_ids
+
     @staticmethod
     def _build_metadata(poi: PoiData) -> dict:
         """PoiData에서 ChromaDB metadata dict 생성 (전체 필드 포함)"""
@@ -300,10 +320,9 @@ class VectorSearchAgent(BaseVectorSearchAgent):
             # 2. ChromaDB 읽기/쓰기는 lock 안에서 수행
             async with self._write_lock:
                 # 컬렉션에 이미 존재하는 ID 필터링
-                existing = await asyncio.to_thread(
-                    lambda: self._collection.get(ids=candidate_ids)
+                existing_ids = await asyncio.to_thread(
+                    self._get_existing_ids, candidate_ids
                 )
-                existing_ids = set(existing["ids"]) if existing and existing.get("ids") else set()
                 new_pois = [poi for poi in unique_pois if poi.id not in existing_ids]
 
                 if not new_pois:
@@ -251,6 +251,35 @@ class TestVectorSearchAgentUnit:
         assert count == 0
         mock_collection.add.assert_not_called()
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_add_pois_batch_existing_ids_checked_in_chunks(self, mock_embedding_pipeline, mock_collection):
+        """대량 배치의 기존 ID 조회가 청크 단위로 나뉘고 결과가 합쳐지는지 확인"""
+        from app.core.Agents.Poi.VectorDB.VectorSearchAgent import EXISTING_ID_CHUNK_SIZE
+
+        agent = VectorSearchAgent(embedding_pipeline=mock_embedding_pipeline)
+        agent._initialized = True
+        agent._collection = mock_collection
+
+        total = EXISTING_ID_CHUNK_SIZE * 2 + 1
+        pois = [
+            PoiData(id=f"poi-{i}", name=f"장소{i}", category=PoiCategory.RESTAURANT,
+                    description="", source=PoiSource.WEB_SEARCH, raw_text=f"텍스트{i}")
+            for i in range(total)
+        ]
+        # 각 청크에서 첫 번째 ID만 이미 존재한다고 시뮬레이션
+        mock_collection.get.side_effect = lambda ids, **kwargs: {"ids": [ids[0]]}
+
+        count = await agent.add_pois_batch(pois)
+
+        assert mock_collection.get.call_count == 3
+        for call in mock_collection.get.call_args_list:
+            assert len(call.kwargs["ids"]) <= EXISTING_ID_CHUNK_SIZE
+        assert count == total - 3
+        _, kwargs = mock_collection.add.call_args
+        assert "poi-0" not in kwargs["ids"]
+        assert f"poi-{EXISTING_ID_CHUNK_SIZE}" not in kwargs["ids"]
+
 
 # =============================================================================
 # 통합 테스트: 모든 의존성 실제 사용 (Memory Mode)
@@ -1,3 +1,7 @@
+import asyncio
+from typing import Awaitable, Iterable, List, TypeVar
+
+import httpx
 import pytest
 from pydantic import BaseModel
 from app.core.LLMClient.VllmClient import VllmClient
@@ -8,18 +12,47 @@ class SimpleResponse(BaseModel):
     answer: str
     confidence: int
 
+R = TypeVar("R")
+
+# 공유 샘플 메시지 (읽기 전용) - 테스트마다 Pydantic 검증을 반복하지 않도록 한 번만 생성
+_SAMPLE_MSG = ChatMessage.model_construct(
+    content=[MessageData.model_construct(role="user", content="Hello, are you working?")]
+)
+
+
+# --- Helpers ---
+async def bounded_gather(coros: Iterable[Awaitable[R]], limit: int = 32) -> List[R]:
+    """동시 실행 수를 limit으로 제한하며 코루틴들을 병렬 실행 (결과는 입력 순서 유지)"""
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(coro: Awaitable[R]) -> R:
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros))
+
+
 # --- Fixtures ---
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
+    # 세션 전체에서 하나의 클라이언트를 공유 (테스트마다 재생성하지 않음)
     return VllmClient()
 
+@pytest.fixture(scope="session")
+def vllm_available(client):
+    """vLLM 서버 헬스체크를 세션당 한 번만 수행하고, 응답이 없으면 통합 테스트를 skip"""
+    if not client.base_url:
+        pytest.skip("vLLM base_url 미설정")
+    try:
+        response = httpx.get(f"{client.base_url}/health", timeout=1.0)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        pytest.skip(f"vLLM 서버에 연결할 수 없음: {e}")
+    return True
+
 @pytest.fixture
 def chat_message():
-    return ChatMessage(
-        content=[
-            MessageData(role="user", content="Hello, are you working?")
-        ]
-    )
+    return _SAMPLE_MSG
 
 # --- Unit Tests (Accuracy Verification) ---
 class TestVllmClientUnit:
@@ -66,72 +99,77 @@ class TestVllmClientUnit:
         assert result.content[1].content == "Hi"
 
 # --- Integration Tests (Existence Verification) ---
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("vllm_available")
 class TestVllmClientIntegration:
     """
     call_llm 관련 함수들은 실행 결과가 실제로 나오는지만 확인
-    (Note: 실제 vLLM 서버가 연결되어 있어야 성공함)
+    (Note: 실제 vLLM 서버가 필요하며, 헬스체크 실패 시 skip)
+    모든 테스트가 세션 단위 이벤트 루프 하나를 공유
     """
 
-    def test_call_llm(self, client, chat_message):
+    async def test_call_llm(self, client, chat_message):
         """call_llm 실행 및 결과 반환 확인"""
-        import asyncio
-        async def run():
-            result = await client.call_llm(chat_message)
-            print(f"\n[call_llm] Result: {result}")
-            return result
-
-        try:
-            result = asyncio.run(run())
-            # 결과가 문자열이고 비어있지 않은지 확인
+        result = await client.call_llm(chat_message)
+        print(f"\n[call_llm] Result: {result}")
+        # 결과가 문자열이고 비어있지 않은지 확인
+        assert isinstance(result, str)
+        assert len(result) > 0
+        assert "LLM 서버 오류" not in result
+        assert "LLM 서버 요청 실패" not in result
+
+    async def test_call_llm_stream(self, client, chat_message):
+        """call_llm_stream 실행 및 스트리밍 결과 반환 확인"""
+        parts: list[str] = []
+        async for chunk in client.call_llm_stream(chat_message):
+            assert isinstance(chunk, str)
+            parts.append(chunk)
+        full_content = "".join(parts)
+        print(f"\n[call_llm_stream] Result: {full_content}")
+
+        # 전체 스트리밍 결과가 존재하는지 확인
+        assert len(full_content) > 0
+        assert "LLM 서버 오류" not in full_content
+        assert "LLM 서버 요청 실패" not in full_content
+
+    async def test_call_llm_structured(self, client):
+        """call_llm_structured 실행 및 Pydantic 모델 반환 확인"""
+        prompt = ChatMessage(
+            content=[
+                MessageData(role="user", content="Generate a sample JSON with answer='Test Success' and confidence=99.")
+            ]
+        )
+        result = await client.call_llm_structured(prompt, SimpleResponse)
+        print(f"\n[call_llm_structured] Result: {result}")
+
+        # 결과가 SimpleResponse 타입인지 확인
+        assert isinstance(result, SimpleResponse)
+        assert isinstance(result.answer, str)
+        assert isinstance(result.confidence, int)
+
+    @pytest.mark.benchmark
+    async def test_call_llm_concurrent_throughput(self, client):
+        """요청 코퍼스를 동시 실행 수 32로 제한해 처리량 확인 (vLLM 연속 배칭 활용)"""
+        import time
+        num_requests = 64
+        max_concurrency = 32
+        prompts = [
+            _SAMPLE_MSG.model_copy(update={
+                "content": [MessageData.model_construct(role="user", content=f"Say hello in one short sentence. (#{i})")]
+            })
+            for i in range(num_requests)
+        ]
+
+        start = time.perf_counter()
+        results = await bounded_gather(
+            (client.call_llm(prompt) for prompt in prompts), limit=max_concurrency
+        )
+        elapsed = time.perf_counter() - start
+        print(f"\n[call_llm x{num_requests}, concurrency={max_concurrency}] {elapsed:.2f}s ({num_requests / elapsed:.2f} req/s)")
+
+        assert len(results) == num_requests
+        for result in results:
             assert isinstance(result, str)
             assert len(result) > 0
             assert "LLM 서버 오류" not in result
             assert "LLM 서버 요청 실패" not in result
-        except Exception as e:
-            pytest.fail(f"call_llm execution failed: {e}")
-
-    def test_call_llm_stream(self, client, chat_message):
-        """call_llm_stream 실행 및 스트리밍 결과 반환 확인"""
-        import asyncio
-        async def run():
-            full_content = ""
-            async for chunk in client.call_llm_stream(chat_message):
-                assert isinstance(chunk, str)
-                full_content += chunk
-            return full_content
-
-        try:
-            full_content = asyncio.run(run())
-            print(f"\n[call_llm_stream] Result: {full_content}")
-            
-            # 전체 스트리밍 결과가 존재하는지 확인
-            assert len(full_content) > 0
-            assert "LLM 서버 오류" not in full_content
-            assert "LLM 서버 요청 실패" not in full_content
-        except Exception as e:
-            pytest.fail(f"call_llm_stream execution failed: {e}")
-
-    def test_call_llm_structured(self, client):
-        """call_llm_structured 실행 및 Pydantic 모델 반환 확인"""
-        import asyncio
-        async def run():
-            prompt = ChatMessage(
-                content=[
-                    MessageData(role="user", content="Generate a sample JSON with answer='Test Success' and confidence=99.")
-                ]
-            )
-            return await client.call_llm_structured(prompt, SimpleResponse)
-
-        try:
-            result = asyncio.run(run())
-            print(f"\n[call_llm_structured] Result: {result}")
-            
-            # 결과가 SimpleResponse 타입인지 확인
-            assert isinstance(result, SimpleResponse)
-            assert isinstance(result.answer, str)
-            assert isinstance(result.confidence, int)
-            
-        except Exception as e:
-            # 서버 연결 실패 등의 이유로 실패할 수 있음. 
-            # 단순히 결과가 나오는지 확인하는 것이 목적이므로, 에러 발생 시 출력하고 fail 처리
-            pytest.fail(f"call_llm_structured failed: {e}")
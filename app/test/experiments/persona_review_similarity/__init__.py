@@ -10,8 +10,20 @@ Usage:
     python run_experiment.py --config config/experiment_config.yaml
 """
 
-from .core.experiment_runner import ExperimentRunner
-from .core.data_loader import DataLoader
-from .core.metrics import MetricsCalculator
+import importlib
 
-__all__ = ["ExperimentRunner", "DataLoader", "MetricsCalculator"]
+# Exports are imported on first access, so importing only the registries
+# (e.g. run_experiment.py --list-variables) skips the runner and its LLM client.
+_EXPORTS = {
+    "ExperimentRunner": ".core.experiment_runner",
+    "DataLoader": ".core.data_loader",
+    "MetricsCalculator": ".core.metrics",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
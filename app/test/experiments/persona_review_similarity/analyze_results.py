@@ -9,20 +9,62 @@ Usage:
 """
 
 import argparse
+import csv
+import functools
 import json
+import os
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional fast path
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # optional fast path
+    njit = None
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    raw = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    # stdlib json also accepts UTF-8 bytes; skips the text-mode I/O layer
+    return json.loads(raw)
+
+
 def load_results(path: Path) -> Dict[str, Any]:
-    """Load experiment results from JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load experiment results from JSON file (orjson when available).
+
+    Parsed results are cached per (path, mtime) and shared between calls;
+    treat the returned dict as read-only.
+    """
+    path = Path(path)
+    return _load_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+def find_latest_json(directory: Path) -> Path:
+    """Return the most recently modified JSON file in a directory, or None."""
+    latest, latest_mtime = None, -1.0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime > latest_mtime:
+                latest, latest_mtime = entry.path, mtime
+    return Path(latest) if latest else None
 
 
 def print_summary(data: Dict[str, Any]) -> None:
@@ -45,61 +87,58 @@ def print_summary(data: Dict[str, Any]) -> None:
         print(f"  Value: {best['metrics'][metric]:.4f}")
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _group_mean(ids: np.ndarray, scores: np.ndarray, n_groups: int) -> np.ndarray:
+        """Mean of scores per integer group id (compiled single pass)."""
+        sums = np.zeros(n_groups, dtype=np.float64)
+        counts = np.zeros(n_groups, dtype=np.float64)
+        for i in range(ids.shape[0]):
+            sums[ids[i]] += scores[i]
+            counts[ids[i]] += 1.0
+        return sums / counts
+else:
+    def _group_mean(ids: np.ndarray, scores: np.ndarray, n_groups: int) -> np.ndarray:
+        """Mean of scores per integer group id."""
+        sums = np.bincount(ids, weights=scores, minlength=n_groups)
+        counts = np.bincount(ids, minlength=n_groups)
+        return sums / counts
+
+
+def _group_means(keys: List[str], scores: np.ndarray) -> List[Tuple[str, float]]:
+    """Mean score per distinct key, sorted by key."""
+    labels, inverse = np.unique(np.asarray(keys), return_inverse=True)
+    means = _group_mean(inverse.astype(np.int64), scores, len(labels))
+    return list(zip(labels.tolist(), means.tolist()))
+
+
 def analyze_by_variable(data: Dict[str, Any]) -> None:
     """Analyze results grouped by each variable."""
     results = data["results"]
-
-    # Group by prompt
-    print("\n" + "=" * 60)
-    print("ANALYSIS BY PROMPT")
-    print("=" * 60)
-    prompts = {}
-    for r in results:
-        p = r["prompt"]
-        if p not in prompts:
-            prompts[p] = []
-        prompts[p].append(r["metrics"]["discrimination_score"])
-
-    for prompt, scores in sorted(prompts.items()):
-        avg = sum(scores) / len(scores)
-        print(f"  {prompt:20} avg_disc={avg:.4f}")
-
-    # Group by formatter
-    print("\n" + "=" * 60)
-    print("ANALYSIS BY FORMATTER")
-    print("=" * 60)
-    formatters = {}
-    for r in results:
-        f = r["formatter"]
-        if f not in formatters:
-            formatters[f] = []
-        formatters[f].append(r["metrics"]["discrimination_score"])
-
-    for formatter, scores in sorted(formatters.items()):
-        avg = sum(scores) / len(scores)
-        print(f"  {formatter:20} avg_disc={avg:.4f}")
-
-    # Group by embedder
-    print("\n" + "=" * 60)
-    print("ANALYSIS BY EMBEDDER")
-    print("=" * 60)
-    embedders = {}
-    for r in results:
-        e = r["embedder"]
-        if e not in embedders:
-            embedders[e] = []
-        embedders[e].append(r["metrics"]["discrimination_score"])
-
-    for embedder, scores in sorted(embedders.items()):
-        avg = sum(scores) / len(scores)
-        print(f"  {embedder:25} avg_disc={avg:.4f}")
+    scores = np.fromiter(
+        (r["metrics"]["discrimination_score"] for r in results),
+        dtype=np.float64,
+        count=len(results),
+    )
+
+    for title, key, width in (
+        ("PROMPT", "prompt", 20),
+        ("FORMATTER", "formatter", 20),
+        ("EMBEDDER", "embedder", 25),
+    ):
+        print("\n" + "=" * 60)
+        print(f"ANALYSIS BY {title}")
+        print("=" * 60)
+        if not results:
+            continue
+        for name, avg in _group_means([r[key] for r in results], scores):
+            print(f"  {name:{width}} avg_disc={avg:.4f}")
 
 
 def create_heatmap(data: Dict[str, Any], output_path: str = None) -> None:
     """Create heatmap visualization."""
     try:
         import matplotlib.pyplot as plt
-        import numpy as np
     except ImportError:
         print("matplotlib required for plotting. Install with: pip install matplotlib")
         return
@@ -116,14 +155,17 @@ def create_heatmap(data: Dict[str, Any], output_path: str = None) -> None:
     if len(embedders) == 1:
         axes = [axes]
 
+    prompt_idx = {p: i for i, p in enumerate(prompts)}
+    fmt_idx = {f: j for j, f in enumerate(formatters)}
+    by_embedder: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for r in results:
+        by_embedder[r["embedder"]].append(r)
+
     for idx, embedder in enumerate(embedders):
         # Build matrix
         matrix = np.zeros((len(prompts), len(formatters)))
-        for r in results:
-            if r["embedder"] == embedder:
-                i = prompts.index(r["prompt"])
-                j = formatters.index(r["formatter"])
-                matrix[i, j] = r["metrics"]["discrimination_score"]
+        for r in by_embedder[embedder]:
+            matrix[prompt_idx[r["prompt"]], fmt_idx[r["formatter"]]] = r["metrics"]["discrimination_score"]
 
         ax = axes[idx]
         im = ax.imshow(matrix, cmap="YlOrRd", aspect="auto")
@@ -150,22 +192,29 @@ def create_heatmap(data: Dict[str, Any], output_path: str = None) -> None:
         plt.show()
 
 
+_CSV_HEADER = (
+    "prompt", "formatter", "embedder",
+    "avg_related_sim", "avg_unrelated_sim", "discrimination",
+    "top_3", "top_5", "top_10",
+)
+_CSV_METRIC_KEYS = (
+    "avg_related_similarity", "avg_unrelated_similarity", "discrimination_score",
+    "top_3_accuracy", "top_5_accuracy", "top_10_accuracy",
+)
+
+
 def export_csv(data: Dict[str, Any], output_path: str) -> None:
     """Export results to CSV."""
-    results = data["results"]
+    rows = [
+        (r["prompt"], r["formatter"], r["embedder"],
+         *[f"{r['metrics'][k]:.4f}" for k in _CSV_METRIC_KEYS])
+        for r in data["results"]
+    ]
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        # Header
-        f.write("prompt,formatter,embedder,avg_related_sim,avg_unrelated_sim,discrimination,top_3,top_5,top_10\n")
-
-        for r in results:
-            m = r["metrics"]
-            f.write(
-                f"{r['prompt']},{r['formatter']},{r['embedder']},"
-                f"{m['avg_related_similarity']:.4f},{m['avg_unrelated_similarity']:.4f},"
-                f"{m['discrimination_score']:.4f},"
-                f"{m['top_3_accuracy']:.4f},{m['top_5_accuracy']:.4f},{m['top_10_accuracy']:.4f}\n"
-            )
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(_CSV_HEADER)
+        writer.writerows(rows)
 
     print(f"CSV exported to: {output_path}")
 
@@ -183,12 +232,12 @@ def main() -> int:
     path = Path(args.path)
 
     if args.all and path.is_dir():
-        files = list(path.glob("*.json"))
-        if not files:
+        # Analyze most recent
+        latest = find_latest_json(path)
+        if latest is None:
             print(f"No JSON files found in {path}")
             return 1
-        # Analyze most recent
-        path = max(files, key=lambda f: f.stat().st_mtime)
+        path = latest
         print(f"Analyzing most recent: {path.name}")
 
     if not path.exists():
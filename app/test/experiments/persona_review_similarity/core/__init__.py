@@ -1,15 +1,23 @@
 """Core modules for experiment execution."""
 
-from .data_loader import DataLoader, PersonaData, ReviewData
-from .metrics import MetricsCalculator, ExperimentMetrics
-from .experiment_runner import ExperimentRunner, ExperimentResult
-
-__all__ = [
-    "DataLoader",
-    "PersonaData",
-    "ReviewData",
-    "MetricsCalculator",
-    "ExperimentMetrics",
-    "ExperimentRunner",
-    "ExperimentResult",
-]
+import importlib
+
+# Imported on first access; see the package __init__
+_EXPORTS = {
+    "DataLoader": ".data_loader",
+    "PersonaData": ".data_loader",
+    "ReviewData": ".data_loader",
+    "EmbeddingCache": ".embedding_cache",
+    "MetricsCalculator": ".metrics",
+    "ExperimentMetrics": ".metrics",
+    "ExperimentRunner": ".experiment_runner",
+    "ExperimentResult": ".experiment_runner",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
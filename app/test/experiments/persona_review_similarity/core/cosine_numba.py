@@ -0,0 +1,48 @@
+"""
+Numba Cosine Similarity Kernel.
+
+Fallback for numpy builds linked against no optimized BLAS, where
+``P @ Q.T`` runs numpy's unblocked reference matmul. The kernel expects
+rows that are already L2-normalized, so cosine reduces to a dot product.
+
+Order of preference in MetricsCalculator.similarity_matrix:
+optimized BLAS matmul -> this kernel -> plain numpy matmul.
+"""
+
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional fast path
+    njit = None
+
+# BLAS builds that numpy's matmul can dispatch to efficiently
+_OPTIMIZED_BLAS_NAMES = ("openblas", "mkl", "accelerate", "blis", "flexiblas", "atlas")
+
+
+@functools.lru_cache(maxsize=None)
+def has_optimized_blas() -> bool:
+    """Whether numpy is linked against an optimized BLAS (assumed True if unknown)."""
+    try:
+        config = np.show_config(mode="dicts")
+        blas = config["Build Dependencies"]["blas"]
+    except Exception:
+        return True
+    name = str(blas.get("name", "")).lower()
+    return bool(blas.get("found")) and any(n in name for n in _OPTIMIZED_BLAS_NAMES)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def cosine_matrix(P: np.ndarray, Q: np.ndarray, out: np.ndarray) -> None:
+        """Write P @ Q.T into out for row-normalized P [N, D] and Q [M, D]."""
+        for i in prange(P.shape[0]):
+            for j in range(Q.shape[0]):
+                s = 0.0
+                for k in range(P.shape[1]):
+                    s += P[i, k] * Q[j, k]
+                out[i, j] = s
+else:
+    cosine_matrix = None
@@ -5,144 +5,173 @@ Updated to use production PoiData directly:
 - Removed custom POIData class, uses app.core.models.PoiAgentDataclass.poi.PoiData
 - ReviewData.pois is List[PoiData]
 - JSON data must match PoiData schema (raw_text, source required)
+- Files are parsed and validated in a single pass via pydantic model_validate_json
 """
 
-import json
-from dataclasses import dataclass, field
+import asyncio
+import functools
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 from app.core.models.PersonaAgentDataclass.persona import QAItem
 from app.core.models.PoiAgentDataclass.poi import PoiData, PoiSource, PoiCategory
 
 
-@dataclass
-class ItineraryRequestData:
+# Required keys per record (checked with one set difference each)
+_PERSONA_REQUIRED_KEYS = frozenset({"id", "name", "qa_items"})
+_POI_REQUIRED_KEYS = frozenset({"id", "name", "raw_text", "source"})
+
+
+class ItineraryRequestData(BaseModel):
     """ItineraryRequest data matching app/schemas/persona.py"""
-    tripId: int
-    arrivalDate: str
-    arrivalTime: str
-    departureDate: str
-    departureTime: str
-    travelCity: str
-    totalBudget: int
-    travelTheme: List[str]
-    wantedPlace: List[str]
+
+    model_config = ConfigDict(frozen=True)
+
+    tripId: int = 0
+    arrivalDate: str = ""
+    arrivalTime: str = ""
+    departureDate: str = ""
+    departureTime: str = ""
+    travelCity: str = ""
+    totalBudget: int = 0
+    travelTheme: List[str] = Field(default_factory=list)
+    wantedPlace: List[str] = Field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ItineraryRequestData":
-        return cls(
-            tripId=data.get("tripId", 0),
-            arrivalDate=data.get("arrivalDate", ""),
-            arrivalTime=data.get("arrivalTime", ""),
-            departureDate=data.get("departureDate", ""),
-            departureTime=data.get("departureTime", ""),
-            travelCity=data.get("travelCity", ""),
-            totalBudget=data.get("totalBudget", 0),
-            travelTheme=data.get("travelTheme", []),
-            wantedPlace=data.get("wantedPlace", []),
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class PersonaData:
+class PersonaData(BaseModel):
     """Persona data matching TravelPersonaAgent structure."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
-    itinerary_request: Optional[ItineraryRequestData]
+    itinerary_request: Optional[ItineraryRequestData] = None
     qa_items: List[QAItem]
-    related_poi_ids: List[str]
-    unrelated_poi_ids: List[str]
+    related_poi_ids: List[str] = Field(default_factory=list)
+    unrelated_poi_ids: List[str] = Field(default_factory=list)
 
+    @model_validator(mode="before")
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "PersonaData":
-        # Parse itinerary_request if present
-        itinerary_data = data.get("itinerary_request")
-        itinerary_request = ItineraryRequestData.from_dict(itinerary_data) if itinerary_data else None
-
-        # Parse QA items
-        qa_items = [
-            QAItem(
-                id=qa.get("id", i),
-                question=qa["question"],
-                answer=qa.get("answer"),
-            )
-            for i, qa in enumerate(data.get("qa_items", []))
+    def _check_required_keys(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            missing = _PERSONA_REQUIRED_KEYS - data.keys()
+            if missing:
+                raise ValueError(f"Persona missing required keys: {sorted(missing)}")
+        return data
+
+    @field_validator("itinerary_request", mode="before")
+    @classmethod
+    def _empty_itinerary_as_none(cls, value: Any) -> Any:
+        # An empty itinerary_request object means "not provided"
+        return value or None
+
+    @field_validator("qa_items", mode="before")
+    @classmethod
+    def _default_qa_ids(cls, value: Any) -> Any:
+        # QA items without an explicit id are numbered by position;
+        # items that already carry an id are passed through without copying
+        if not isinstance(value, list):
+            return value
+        return [
+            {**qa, "id": i} if isinstance(qa, dict) and "id" not in qa else qa
+            for i, qa in enumerate(value)
         ]
 
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            itinerary_request=itinerary_request,
-            qa_items=qa_items,
-            related_poi_ids=data.get("related_poi_ids", []),
-            unrelated_poi_ids=data.get("unrelated_poi_ids", []),
-        )
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PersonaData":
+        return cls.model_validate(data)
+
+
+# Precomputed value -> member maps: one dict lookup instead of Enum.__call__ + exception
+_CATEGORY_BY_VALUE: Dict[str, PoiCategory] = {c.value: c for c in PoiCategory}
+_SOURCE_BY_VALUE: Dict[str, PoiSource] = {s.value: s for s in PoiSource}
+
+
+def _normalize_poi_dict(data: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Fill defaults and coerce unknown enum values before PoiData validation."""
+    missing = _POI_REQUIRED_KEYS - data.keys()
+    if missing:
+        raise ValueError(f"POI {index} missing required keys: {sorted(missing)}")
 
+    category = _CATEGORY_BY_VALUE.get(data.get("category", "other"), PoiCategory.OTHER)
+    source = _SOURCE_BY_VALUE.get(data.get("source", "web_search"), PoiSource.WEB_SEARCH)
+    return {**data, "category": category, "source": source}
 
-def _parse_poi_from_dict(data: Dict[str, Any]) -> PoiData:
-    """Parse a JSON dict into a production PoiData object."""
-    # Map category string to PoiCategory enum
-    category_str = data.get("category", "other")
-    try:
-        category = PoiCategory(category_str)
-    except ValueError:
-        category = PoiCategory.OTHER
-
-    # Map source string to PoiSource enum
-    source_str = data.get("source", "web_search")
-    try:
-        source = PoiSource(source_str)
-    except ValueError:
-        source = PoiSource.WEB_SEARCH
-
-    return PoiData(
-        id=data["id"],
-        name=data["name"],
-        category=category,
-        description=data.get("description", ""),
-        city=data.get("city"),
-        address=data.get("address"),
-        source=source,
-        source_url=data.get("source_url"),
-        raw_text=data.get("raw_text", data["name"]),
-        google_place_id=data.get("google_place_id"),
-        latitude=data.get("latitude"),
-        longitude=data.get("longitude"),
-        google_maps_uri=data.get("google_maps_uri"),
-        types=data.get("types", []),
-        primary_type=data.get("primary_type"),
-        google_rating=data.get("google_rating"),
-        user_rating_count=data.get("user_rating_count"),
-        price_level=data.get("price_level"),
-        price_range=data.get("price_range"),
-        website_uri=data.get("website_uri"),
-        phone_number=data.get("phone_number"),
-        editorial_summary=data.get("editorial_summary"),
-        generative_summary=data.get("generative_summary"),
-        review_summary=data.get("review_summary"),
-    )
-
-
-@dataclass
-class ReviewData:
+
+class ReviewData(BaseModel):
     """Collection of POI reviews using production PoiData."""
 
-    version: str
+    model_config = ConfigDict(frozen=True)
+
+    version: str = "1.0"
     pois: List[PoiData]
 
+    _by_id: Dict[str, PoiData] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _check_pois_key(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "pois" not in data:
+            raise ValueError("Review dataset must have 'pois' key")
+        return data
+
+    @field_validator("pois", mode="before")
+    @classmethod
+    def _normalize_pois(cls, value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        return [
+            _normalize_poi_dict(p, i) if isinstance(p, dict) else p
+            for i, p in enumerate(value)
+        ]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ReviewData":
-        pois = [_parse_poi_from_dict(poi) for poi in data.get("pois", [])]
-        return cls(version=data.get("version", "1.0"), pois=pois)
+        return cls.model_validate(data)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Build the id index once; first occurrence wins like the old linear scan
+        by_id: Dict[str, PoiData] = {}
+        for poi in self.pois:
+            by_id.setdefault(poi.id, poi)
+        self._by_id = by_id
 
     def get_poi(self, poi_id: str) -> Optional[PoiData]:
         """Get POI by ID."""
-        for poi in self.pois:
-            if poi.id == poi_id:
-                return poi
-        return None
+        return self._by_id.get(poi_id)
+
+    def get_many(self, poi_ids: Iterable[str]) -> List[PoiData]:
+        """Get POIs by ID, skipping unknown IDs."""
+        by_id = self._by_id
+        return [by_id[i] for i in poi_ids if i in by_id]
+
+
+class _PersonaDataset(BaseModel):
+    """Top-level layout of a persona dataset file."""
+
+    model_config = ConfigDict(frozen=True)
+
+    personas: List[PersonaData]
+
+    @model_validator(mode="before")
+    @classmethod
+    def _check_personas_key(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "personas" not in data:
+            raise ValueError("Persona dataset must have 'personas' key")
+        return data
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_file_cached(path_str: str, mtime_ns: int, model: type[BaseModel]) -> BaseModel:
+    """Validate a dataset file; mtime_ns in the key invalidates on change."""
+    return model.model_validate_json(Path(path_str).read_bytes())
 
 
 class DataLoader:
@@ -152,65 +181,67 @@ class DataLoader:
         if base_path is None:
             base_path = Path(__file__).parent.parent / "data"
         self.base_path = Path(base_path)
+        self._resolved_paths: Dict[Tuple[str, str], Path] = {}
 
     def load_personas(self, file_path: Union[str, Path]) -> List[PersonaData]:
         """Load persona dataset from JSON file."""
         path = self._resolve_path(file_path, "personas")
-        data = self._load_json(path)
-        self._validate_persona_schema(data)
-        return [PersonaData.from_dict(p) for p in data.get("personas", [])]
+        # Copy so callers cannot mutate the cached dataset's list
+        return list(self._load_json(path, _PersonaDataset).personas)
 
     def load_reviews(self, file_path: Union[str, Path]) -> ReviewData:
         """Load review dataset from JSON file."""
         path = self._resolve_path(file_path, "reviews")
-        data = self._load_json(path)
-        self._validate_review_schema(data)
-        return ReviewData.from_dict(data)
+        return self._load_json(path, ReviewData)
+
+    async def load_all_personas(
+        self, file_paths: Iterable[Union[str, Path]]
+    ) -> List[List[PersonaData]]:
+        """Load several persona datasets concurrently (one worker thread per file)."""
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.load_personas, p) for p in file_paths)
+        )
+
+    async def load_all_reviews(
+        self, file_paths: Iterable[Union[str, Path]]
+    ) -> List[ReviewData]:
+        """Load several review datasets concurrently (one worker thread per file)."""
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.load_reviews, p) for p in file_paths)
+        )
 
     def _resolve_path(self, file_path: Union[str, Path], subdir: str) -> Path:
-        """Resolve file path, checking multiple locations."""
+        """Resolve file path, checking multiple locations (memoized per instance)."""
+        cache_key = (str(file_path), subdir)
+        cached = self._resolved_paths.get(cache_key)
+        if cached is not None:
+            return cached
+
         path = Path(file_path)
-        if path.is_absolute() and path.exists():
-            return path
-        # Check relative to base_path/subdir
         relative_path = self.base_path / subdir / path
-        if relative_path.exists():
-            return relative_path
-        # Check relative to base_path directly
         direct_path = self.base_path / path
-        if direct_path.exists():
-            return direct_path
+        # Absolute path first, then relative to base_path/subdir, then base_path directly
+        candidates = (relative_path, direct_path)
+        if path.is_absolute():
+            candidates = (path,) + candidates
+        # One stat per candidate
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                self._resolved_paths[cache_key] = candidate
+                return candidate
         raise FileNotFoundError(
             f"Dataset not found: {file_path}. "
             f"Checked: {path}, {relative_path}, {direct_path}"
         )
 
-    def _load_json(self, path: Path) -> Dict[str, Any]:
-        """Load JSON file."""
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    def _load_json(self, path: Path, model: type[BaseModel]) -> Any:
+        """Parse and validate a JSON file in one pass (pydantic/jiter).
 
-    def _validate_persona_schema(self, data: Dict[str, Any]) -> None:
-        """Validate persona dataset schema."""
-        if "personas" not in data:
-            raise ValueError("Persona dataset must have 'personas' key")
-        for i, persona in enumerate(data["personas"]):
-            required = ["id", "name", "qa_items"]
-            for key in required:
-                if key not in persona:
-                    raise ValueError(
-                        f"Persona {i} missing required key: {key}"
-                    )
-
-    def _validate_review_schema(self, data: Dict[str, Any]) -> None:
-        """Validate review dataset schema."""
-        if "pois" not in data:
-            raise ValueError("Review dataset must have 'pois' key")
-        for i, poi in enumerate(data["pois"]):
-            required = ["id", "name", "raw_text", "source"]
-            for key in required:
-                if key not in poi:
-                    raise ValueError(f"POI {i} missing required key: {key}")
+        Results are cached per (path, mtime), so repeated loads of an
+        unchanged file are free. Schema errors surface as
+        pydantic.ValidationError (a ValueError).
+        """
+        return _validate_file_cached(str(path), path.stat().st_mtime_ns, model)
 
     def list_persona_datasets(self) -> List[str]:
         """List available persona datasets."""
@@ -0,0 +1,196 @@
+"""
+On-disk Embedding Cache for Experiment Sweeps.
+
+Embeddings depend only on (embedder, task type, text), not on which
+prompt/formatter combination produced the text, so each distinct triple
+is embedded once and reused across the whole P x R x E grid and across
+runs.
+
+Storage is a single sqlite3 file; vectors are stored as raw float32 bytes
+(lossless for sentence-transformers output). Passing dtype="float16" stores
+half-size vectors in a separate table, which halves disk and read bandwidth
+for normalized embeddings at the cost of ~1e-3 rounding in cosine scores.
+
+Whole text lists (e.g. every POI under one formatter) are additionally
+snapshotted as .npy matrices named by a hash of their contents, so a
+repeated sweep memory-maps one file instead of looking up every row.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from app.core.Agents.Poi.VectorDB.EmbeddingPipeline.BaseEmbeddingPipeline import EmbeddingTaskType
+
+
+class EmbeddingCache:
+    """Content-hash keyed embedding store backed by sqlite3."""
+
+    FILENAME = "embeddings.sqlite3"
+    MATRIX_DIRNAME = "matrices"
+    SUPPORTED_DTYPES = ("float32", "float16")
+    # Keeps "IN (?, ?, ...)" below sqlite's bound-parameter limit
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, cache_dir: Union[str, Path], dtype: str = "float32"):
+        if dtype not in self.SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported cache dtype: {dtype}. Available: {list(self.SUPPORTED_DTYPES)}")
+        self.dtype = np.dtype(dtype)
+        # float32 keeps the original table name so existing caches stay valid
+        self._table = "embeddings" if dtype == "float32" else f"embeddings_{dtype}"
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.cache_dir / self.FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(embedder_name: str, text: str, task_type: EmbeddingTaskType) -> str:
+        """Hash key for one (embedder, task type, text) triple."""
+        raw = f"{embedder_name}\0{task_type.value}\0{text}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(
+        self, embedder_name: str, text: str, task_type: EmbeddingTaskType
+    ) -> Optional[List[float]]:
+        """Return the cached embedding, or None on a miss."""
+        key = self.make_key(embedder_name, text, task_type)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT vector FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=self.dtype).astype(np.float32).tolist()
+
+    def put(
+        self,
+        embedder_name: str,
+        text: str,
+        task_type: EmbeddingTaskType,
+        embedding: List[float],
+    ) -> None:
+        """Store an embedding."""
+        key = self.make_key(embedder_name, text, task_type)
+        blob = np.asarray(embedding, dtype=self.dtype).tobytes()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, vector) VALUES (?, ?)",
+                (key, blob),
+            )
+            self._conn.commit()
+
+    def get_or_compute(
+        self,
+        embedder_name: str,
+        text: str,
+        task_type: EmbeddingTaskType,
+        compute: Callable[[], List[float]],
+    ) -> List[float]:
+        """Return the cached embedding, computing and storing it on a miss."""
+        cached = self.get(embedder_name, text, task_type)
+        if cached is not None:
+            return cached
+        embedding = compute()
+        self.put(embedder_name, text, task_type, embedding)
+        return embedding
+
+    def get_or_compute_batch(
+        self,
+        embedder_name: str,
+        texts: Sequence[str],
+        task_type: EmbeddingTaskType,
+        compute_batch: Callable[[List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """Return an [N, D] float32 array for texts, computing all misses in one call."""
+        keys = [self.make_key(embedder_name, text, task_type) for text in texts]
+
+        found: Dict[str, bytes] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique_keys), self.LOOKUP_CHUNK_SIZE):
+                chunk = unique_keys[start:start + self.LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT key, vector FROM {self._table} WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall())
+
+        # One compute call for every distinct missing text
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            computed = np.asarray(compute_batch(list(missing.values())), dtype=self.dtype)
+            rows = [(key, vec.tobytes()) for key, vec in zip(missing, computed)]
+            with self._lock:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self._table} (key, vector) VALUES (?, ?)", rows
+                )
+                self._conn.commit()
+            found.update(rows)
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(
+            [np.frombuffer(found[key], dtype=self.dtype) for key in keys]
+        ).astype(np.float32, copy=False)
+
+    def matrix_path(
+        self, embedder_name: str, texts: Sequence[str], task_type: EmbeddingTaskType
+    ) -> Path:
+        """Snapshot file for an ordered text list; any change to the list changes the name."""
+        digest = hashlib.blake2b(digest_size=16)
+        for text in texts:
+            digest.update(self.make_key(embedder_name, text, task_type).encode("ascii"))
+        safe_name = embedder_name.replace(os.sep, "_")
+        return (
+            self.cache_dir / self.MATRIX_DIRNAME / safe_name
+            / f"{task_type.value}-{self.dtype.name}-{digest.hexdigest()}.npy"
+        )
+
+    def get_or_compute_matrix(
+        self,
+        embedder_name: str,
+        texts: Sequence[str],
+        task_type: EmbeddingTaskType,
+        compute_batch: Callable[[List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """Return the [N, D] matrix for texts, memory-mapped from a snapshot when one exists.
+
+        The result is in the cache dtype and read-only on a snapshot hit.
+        On a miss, rows come from get_or_compute_batch and the snapshot is
+        written for the next run.
+        """
+        path = self.matrix_path(embedder_name, texts, task_type)
+        if path.exists():
+            return np.load(path, mmap_mode="r")
+
+        matrix = np.ascontiguousarray(
+            self.get_or_compute_batch(embedder_name, texts, task_type, compute_batch),
+            dtype=self.dtype,
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so an interrupted run never leaves a truncated file;
+        # the tmp name is per thread because parallel combinations can share a snapshot
+        tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, matrix)
+        os.replace(tmp_path, path)
+        return matrix
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
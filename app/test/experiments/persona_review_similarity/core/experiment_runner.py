@@ -12,19 +12,27 @@ import asyncio
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from itertools import product
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional fast path
+    orjson = None
+
 from ..registry.prompts import PROMPT_REGISTRY, PromptConfig
-from ..registry.formatters import FORMATTER_REGISTRY, FormatterConfig
+from ..registry.formatters import FORMATTER_REGISTRY, FormatterConfig, format_batch_async
 from ..registry.embedders import EMBEDDER_REGISTRY, create_embedder
 from app.core.Agents.Poi.VectorDB.EmbeddingPipeline.BaseEmbeddingPipeline import EmbeddingTaskType
 from .data_loader import DataLoader, PersonaData, ReviewData
+from .embedding_cache import EmbeddingCache
 from .metrics import MetricsCalculator, ExperimentMetrics
 
 from app.core.models.PoiAgentDataclass.poi import PoiData
@@ -34,6 +42,15 @@ from app.core.models.LlmClientDataclass.ChatMessageDataclass import ChatMessage,
 
 logger = logging.getLogger(__name__)
 
+_FINAL_RESPONSE_RE = re.compile(r"<final_response>(.*?)</final_response>", re.DOTALL)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON (orjson when available, numpy values included)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 @dataclass
 class ExperimentConfig:
@@ -47,6 +64,12 @@ class ExperimentConfig:
     embedders: List[str]
     output_dir: str = "results"
     save_embeddings: bool = True
+    use_embedding_cache: bool = True
+    embedding_cache_dtype: str = "float32"
+    # Cap on in-flight LLM requests (None = unbounded)
+    max_concurrency: Optional[int] = None
+    # Number of embedders / combinations processed at the same time
+    parallel: int = 1
     # TODO: 고정값으로 박아넣음
     llm_client: Optional[Any] = VllmClient()
 
@@ -70,10 +93,14 @@ class ExperimentConfig:
             embedders=variables.get("embedders", list(EMBEDDER_REGISTRY.keys())),
             output_dir=output.get("results_dir", "results"),
             save_embeddings=output.get("save_embeddings", True),
+            use_embedding_cache=output.get("embedding_cache", True),
+            embedding_cache_dtype=output.get("embedding_cache_dtype", "float32"),
+            max_concurrency=exp.get("max_concurrency"),
+            parallel=exp.get("parallel", 1),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityScore:
     """Individual similarity score between persona and POI."""
     persona_id: str
@@ -82,6 +109,45 @@ class SimilarityScore:
     is_related: bool  # Ground truth
 
 
+@dataclass
+class SimilarityMatrix:
+    """All persona x POI similarities of one combination, kept as arrays."""
+    scores: np.ndarray  # [N, M] float32, scores[i, j] = sim(persona_ids[i], poi_ids[j])
+    persona_ids: List[str]
+    poi_ids: List[str]
+    is_related: np.ndarray  # [N, M] bool ground truth
+
+    def top(self, n: int) -> List[SimilarityScore]:
+        """Materialize the n highest-scoring pairs, highest first."""
+        flat = self.scores.ravel()
+        n = min(n, flat.size)
+        if n <= 0:
+            return []
+        top = np.argpartition(flat, -n)[-n:]
+        top = top[np.argsort(-flat[top], kind="stable")]
+        rows, cols = np.unravel_index(top, self.scores.shape)
+        return [
+            SimilarityScore(
+                persona_id=self.persona_ids[i],
+                poi_id=self.poi_ids[j],
+                similarity=float(flat[k]),
+                is_related=bool(self.is_related[i, j]),
+            )
+            for k, i, j in zip(top.tolist(), rows.tolist(), cols.tolist())
+        ]
+
+
+# Summary table order: best related similarity first, ties broken by the remaining metrics
+_SUMMARY_SORT_KEY = attrgetter(
+    "metrics.avg_related_similarity",
+    "metrics.avg_unrelated_similarity",
+    "metrics.top_3_accuracy",
+    "metrics.top_5_accuracy",
+    "metrics.top_10_accuracy",
+    "metrics.discrimination_score",
+)
+
+
 @dataclass
 class ExperimentResult:
     """Result of a single experiment combination."""
@@ -92,11 +158,12 @@ class ExperimentResult:
     metrics: ExperimentMetrics
 
     # Similarity details
-    similarity_scores: List[SimilarityScore] = field(default_factory=list)
+    similarity_scores: Optional[SimilarityMatrix] = None
 
     # Generated content (optional)
-    persona_embeddings: Optional[Dict[str, List[float]]] = None
-    poi_embeddings: Optional[Dict[str, List[float]]] = None
+    # (float32 [N, D] matrix, row ids)
+    persona_embeddings: Optional[Tuple[np.ndarray, List[str]]] = None
+    poi_embeddings: Optional[Tuple[np.ndarray, List[str]]] = None
     generated_personas: Optional[Dict[str, str]] = None
     formatted_reviews: Optional[Dict[str, str]] = None
 
@@ -141,6 +208,27 @@ class ExperimentResults:
             rows.append(row)
         return pd.DataFrame(rows)
 
+    @staticmethod
+    def _result_to_dict(r: ExperimentResult) -> Dict[str, Any]:
+        """Convert one result to its JSON-serializable form."""
+        return {
+            "prompt": r.prompt_name,
+            "formatter": r.formatter_name,
+            "embedder": r.embedder_name,
+            "metrics": asdict(r.metrics),
+            "similarity_scores": [
+                {
+                    "persona_id": s.persona_id,
+                    "poi_id": s.poi_id,
+                    "similarity": round(s.similarity, 4),
+                    "is_related": s.is_related,
+                }
+                for s in (r.similarity_scores.top(100) if r.similarity_scores else [])
+            ],
+            "generated_personas": r.generated_personas or None,
+            "formatted_reviews": r.formatted_reviews or None,
+        }
+
     def save(self, output_dir: str) -> str:
         """Save results to JSON file and markdown summary table."""
         output_path = Path(output_dir)
@@ -149,35 +237,19 @@ class ExperimentResults:
         filename = f"{self.experiment_name}_{self.timestamp}.json"
         filepath = output_path / filename
 
-        # Convert to serializable format with similarity scores
-        data = {
+        # Stream one result at a time instead of building the whole document in memory
+        header = {
             "experiment_name": self.experiment_name,
             "timestamp": self.timestamp,
             "config": self.config,
-            "results": [
-                {
-                    "prompt": r.prompt_name,
-                    "formatter": r.formatter_name,
-                    "embedder": r.embedder_name,
-                    "metrics": asdict(r.metrics),
-                    "similarity_scores": [
-                        {
-                            "persona_id": s.persona_id,
-                            "poi_id": s.poi_id,
-                            "similarity": round(s.similarity, 4),
-                            "is_related": s.is_related,
-                        }
-                        for s in r.similarity_scores[:100]  # Limit to top 100
-                    ],
-                    "generated_personas": dict(sorted(r.generated_personas.items())) if r.generated_personas else None,
-                    "formatted_reviews": dict(sorted(r.formatted_reviews.items())) if r.formatted_reviews else None,
-                }
-                for r in self.results
-            ],
         }
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(_json_dumps(header)[:-1])  # header object minus its closing brace
+            f.write(b', "results": [')
+            for i, r in enumerate(self.results):
+                f.write(b",\n" if i else b"\n")
+                f.write(_json_dumps(self._result_to_dict(r)))
+            f.write(b"\n]}\n")
 
         # Save markdown summary table
         md_filepath = self._save_markdown_summary(output_path)
@@ -185,24 +257,25 @@ class ExperimentResults:
 
         return str(filepath)
 
+    @staticmethod
+    def _summary_row(r: ExperimentResult) -> str:
+        """Render one result as a markdown summary table row."""
+        m = r.metrics
+        return (
+            f"| {r.prompt_name} | {r.formatter_name} | {r.embedder_name} | "
+            f"{m.avg_related_similarity:.4f} | {m.avg_unrelated_similarity:.4f} | "
+            f"{m.std_related_similarity:.4f} | {m.std_unrelated_similarity:.4f} | "
+            f"{m.discrimination_score:.4f} | {m.top_3_accuracy:.4f} | "
+            f"{m.top_5_accuracy:.4f} | {m.top_10_accuracy:.4f} |"
+        )
+
     def _save_markdown_summary(self, output_path: Path) -> str:
         """Save experiment results as a markdown summary table."""
         md_filename = f"{self.experiment_name}_{self.timestamp}_summary.md"
         md_filepath = output_path / md_filename
 
         # Sort results by discrimination_score descending
-        sorted_results = sorted(
-            self.results,
-            key=lambda r: (
-                r.metrics.avg_related_similarity,
-                r.metrics.avg_unrelated_similarity,
-                r.metrics.top_3_accuracy,
-                r.metrics.top_5_accuracy,
-                r.metrics.top_10_accuracy,
-                r.metrics.discrimination_score,
-            ),
-            reverse=True,
-        )
+        sorted_results = sorted(self.results, key=_SUMMARY_SORT_KEY, reverse=True)
 
         lines = [
             f"# Experiment Results: {self.experiment_name}",
@@ -223,15 +296,7 @@ class ExperimentResults:
             "|--------|-----------|----------|-----------------|-------------------|-------------|---------------|----------------|-----------|-----------|------------|",
         ]
 
-        for r in sorted_results:
-            m = r.metrics
-            lines.append(
-                f"| {r.prompt_name} | {r.formatter_name} | {r.embedder_name} | "
-                f"{m.avg_related_similarity:.4f} | {m.avg_unrelated_similarity:.4f} | "
-                f"{m.std_related_similarity:.4f} | {m.std_unrelated_similarity:.4f} | "
-                f"{m.discrimination_score:.4f} | {m.top_3_accuracy:.4f} | "
-                f"{m.top_5_accuracy:.4f} | {m.top_10_accuracy:.4f} |"
-            )
+        lines.extend(self._summary_row(r) for r in sorted_results)
 
         # Add best combination highlight
         best = self.best_combination("discrimination_score")
@@ -267,54 +332,37 @@ class ExperimentResults:
             lines.append("")
             lines.append("#### Personas")
             if r.generated_personas:
-                for pid, text in sorted(r.generated_personas.items()):
+                for pid, text in r.generated_personas.items():
                     lines.append(f"- **{pid}**: {text.replace(chr(10), ' ')}")
 
             lines.append("")
             lines.append("#### Reviews")
             if r.formatted_reviews:
-                for oid, text in sorted(r.formatted_reviews.items()):
+                for oid, text in r.formatted_reviews.items():
                     lines.append(f"- **{oid}**: {text.replace(chr(10), ' ')}")
 
             lines.append("")
             lines.append("---")
 
-        # Add Generated Content Reference
-        lines.append("")
-        lines.append("## Generated Content Reference")
+        with open(md_filepath, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
 
-        # Group by (prompt, formatter) to avoid duplication
-        content_map = {}
-        for r in self.results:
-            key = (r.prompt_name, r.formatter_name)
-            if key not in content_map:
-                content_map[key] = r
+        return str(md_filepath)
 
-        for prompt_name, formatter_name in sorted(content_map.keys()):
-            r = content_map[(prompt_name, formatter_name)]
-            
-            lines.append("")
-            lines.append(f"### Configuration: {prompt_name} + {formatter_name}")
-            
-            lines.append("")
-            lines.append("#### Personas")
-            if r.generated_personas:
-                for pid, text in sorted(r.generated_personas.items()):
-                    lines.append(f"- **{pid}**: {text.replace(chr(10), ' ')}")
 
-            lines.append("")
-            lines.append("#### Reviews")
-            if r.formatted_reviews:
-                for oid, text in sorted(r.formatted_reviews.items()):
-                    lines.append(f"- **{oid}**: {text.replace(chr(10), ' ')}")
+class _BoundedLlmClient:
+    """LLM client proxy that keeps at most `limit` call_llm requests in flight."""
 
-            lines.append("")
-            lines.append("---")
+    def __init__(self, client: Any, limit: int):
+        self._client = client
+        self._semaphore = asyncio.Semaphore(limit)
 
-        with open(md_filepath, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+    async def call_llm(self, *args, **kwargs):
+        async with self._semaphore:
+            return await self._client.call_llm(*args, **kwargs)
 
-        return str(md_filepath)
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
 
 
 class ExperimentRunner:
@@ -334,7 +382,16 @@ class ExperimentRunner:
 
         # Cache for generated content
         self._persona_cache: Dict[Tuple[str, str], str] = {}
-        self._review_cache: Dict[Tuple[str, str], str] = {}            
+        self._review_cache: Dict[Tuple[str, str], str] = {}
+        # Replaced with the rate-limited proxy at the start of each run
+        self._llm_client: Optional[Any] = config.llm_client
+
+        # On-disk embedding cache shared across combinations and runs
+        self._embedding_cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(self.data_loader.base_path / ".cache", dtype=config.embedding_cache_dtype)
+            if config.use_embedding_cache
+            else None
+        )
 
     def _validate_config(self) -> None:
         """Validate that all configured variables exist in registries."""
@@ -360,63 +417,121 @@ class ExperimentRunner:
 
         logger.info(f"Loaded {len(self.personas)} personas and {len(self.reviews.pois)} POIs")
 
-    def generate_persona_text(
-        self, persona: PersonaData, prompt_config: PromptConfig, qa_false: bool = False
-    ) -> str:
-        """Generate persona text using specified prompt. LLM client is required."""
-        cache_key = (persona.id, prompt_config.name)
-        if cache_key in self._persona_cache:
-            return self._persona_cache[cache_key]
+    def _async_llm_client(self) -> Any:
+        """LLM client for the event-loop paths, rate-limited when max_concurrency is set."""
+        client = self.config.llm_client
+        if client is None or not self.config.max_concurrency:
+            return client
+        return _BoundedLlmClient(client, self.config.max_concurrency)
 
+    def _require_llm_client(self) -> None:
         if not self.config.llm_client:
             raise ValueError(
                 "LLM client is required for prompt experiments. "
                 "Set llm_client in ExperimentConfig or use --llm-client option."
             )
 
-        # Generate using prompt template + llm_client.call_llm()
+    @staticmethod
+    def _build_persona_message(
+        persona: PersonaData, prompt_config: PromptConfig, qa_false: bool = False
+    ) -> ChatMessage:
+        """Render the persona prompt into a chat message."""
         prompt_text = prompt_config.generator(
             qa_items=persona.qa_items if not qa_false else [],
             itinerary_request=persona.itinerary_request,
         )
-        
-        messages: ChatMessage = ChatMessage(
+        return ChatMessage(
             content=[
                 MessageData(role="user", content=prompt_text)
             ]
         )
 
+    @staticmethod
+    def _extract_final_response(result: str) -> str:
+        """Extract content inside <final_response> tags, if present."""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    result = pool.submit(
-                        asyncio.run,
-                        self.config.llm_client.call_llm(messages)
-                    ).result()
-            else:
-                result = loop.run_until_complete(
-                    self.config.llm_client.call_llm(messages)
-                )
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
-                self.config.llm_client.call_llm(messages)
-            )
-
-        try: 
-            # Extract content inside <final_response> tags
-            match = re.search(r"<final_response>(.*?)</final_response>", result, re.DOTALL)
+            match = _FINAL_RESPONSE_RE.search(result)
             if match:
                 result = match.group(1).strip()
-        except Exception: 
+        except Exception:
             pass
+        return result
+
+    async def generate_persona_text(
+        self, persona: PersonaData, prompt_config: PromptConfig, qa_false: bool = False
+    ) -> str:
+        """Generate persona text using specified prompt. LLM client is required."""
+        cache_key = (persona.id, prompt_config.name)
+        if cache_key in self._persona_cache:
+            return self._persona_cache[cache_key]
+
+        self._require_llm_client()
+        messages = self._build_persona_message(persona, prompt_config, qa_false)
+        result = await self._llm_client.call_llm(messages)
+        result = self._extract_final_response(result)
 
         self._persona_cache[cache_key] = result
         return result
 
+    async def _generate_personas_async(self, prompt_config: PromptConfig) -> None:
+        """Generate all uncached persona texts for a prompt concurrently.
+
+        All requests are in flight together so the vLLM server can batch them.
+        """
+        pending: Dict[Tuple[str, str], PersonaData] = {}
+        for persona in self.personas:
+            cache_key = (persona.id, prompt_config.name)
+            if cache_key not in self._persona_cache:
+                pending.setdefault(cache_key, persona)
+        if not pending:
+            return
+
+        self._require_llm_client()
+        results = await asyncio.gather(*(
+            self._llm_client.call_llm(self._build_persona_message(persona, prompt_config))
+            for persona in pending.values()
+        ))
+        for cache_key, result in zip(pending, results):
+            self._persona_cache[cache_key] = self._extract_final_response(result)
+
+    async def _format_reviews_async(self, formatter_config: FormatterConfig) -> None:
+        """Format all uncached reviews for an LLM formatter concurrently.
+
+        Non-LLM formatters are cheap and stay on the lazy per-POI path.
+        """
+        if not formatter_config.requires_llm:
+            return
+
+        pending: Dict[Tuple[str, str], PoiData] = {}
+        for poi in self.reviews.pois:
+            cache_key = (poi.id, formatter_config.name)
+            if cache_key not in self._review_cache:
+                pending.setdefault(cache_key, poi)
+        if not pending:
+            return
+
+        if not self.config.llm_client:
+            raise ValueError(
+                f"Formatter {formatter_config.name} requires LLM but no client provided. "
+                f"Set llm_client in ExperimentConfig or use --llm-client option."
+            )
+        results = await format_batch_async(
+            formatter_config.name, pending.values(), llm_client=self._llm_client
+        )
+        for cache_key, result in zip(pending, results):
+            self._review_cache[cache_key] = result
+
+    async def _prefetch_texts_async(
+        self,
+        prompt_configs: List[PromptConfig],
+        formatter_configs: List[FormatterConfig],
+    ) -> None:
+        """Generate persona texts and LLM-formatted reviews for the whole sweep concurrently."""
+        await asyncio.gather(
+            *(self._generate_personas_async(c) for c in prompt_configs),
+            *(self._format_reviews_async(c) for c in formatter_configs),
+        )
+
     def format_review_text(
         self, poi: PoiData, formatter_config: FormatterConfig
     ) -> str:
@@ -442,9 +557,42 @@ class ExperimentRunner:
         self._review_cache[cache_key] = result
         return result
 
+    def _embed_texts(
+        self,
+        embedder: Any,
+        embedder_name: str,
+        texts: List[str],
+        task_type: EmbeddingTaskType,
+    ) -> np.ndarray:
+        """Embed texts with one embed_batch call, going through the on-disk cache when enabled.
+
+        Identical strings (e.g. personas with empty qa_items) are embedded once
+        and scattered back to every position.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        unique_texts, inverse = np.unique(np.asarray(texts, dtype=object), return_inverse=True)
+        unique_list = unique_texts.tolist()
+        if self._embedding_cache is None:
+            U = embedder.embed_batch(unique_list, task_type)
+        else:
+            U = self._embedding_cache.get_or_compute_matrix(
+                embedder_name,
+                unique_list,
+                task_type,
+                lambda misses: embedder.embed_batch(misses, task_type),
+            )
+        return np.asarray(U, dtype=np.float32)[inverse.reshape(-1)]
+
     def run(self) -> ExperimentResults:
         """Run all experiment combinations."""
+        return asyncio.run(self._run_async())
+
+    async def _run_async(self) -> ExperimentResults:
+        """Run all experiment combinations inside a single event loop."""
         self.load_data()
+        # Created here so the semaphore belongs to this run's event loop
+        self._llm_client = self._async_llm_client()
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         results = ExperimentResults(
@@ -466,22 +614,87 @@ class ExperimentRunner:
         )
         logger.info(f"Running {total_combinations} experiment combinations")
 
-        for i, (prompt_name, formatter_name, embedder_name) in enumerate(
-            product(
-                self.config.prompts,
-                self.config.formatters,
+        prompt_configs = [PROMPT_REGISTRY[name] for name in self.config.prompts]
+        formatter_configs = [FORMATTER_REGISTRY[name] for name in self.config.formatters]
+
+        # Fill text caches with batched/concurrent LLM calls up front
+        await self._prefetch_texts_async(prompt_configs, formatter_configs)
+
+        # Texts depend only on the prompt / formatter, so build each set once.
+        # Dicts are filled in id order so saved output needs no re-sorting.
+        personas_by_id = sorted(self.personas, key=attrgetter("id"))
+        pois_by_id = sorted(self.reviews.pois, key=attrgetter("id"))
+        review_texts: Dict[str, Dict[str, str]] = {
+            config.name: {
+                poi.id: self.format_review_text(poi, config)
+                for poi in pois_by_id
+            }
+            for config in formatter_configs
+        }
+
+        persona_texts_by_prompt: Dict[str, Dict[str, str]] = {}
+        for prompt_config in prompt_configs:
+            persona_texts_by_prompt[prompt_config.name] = {
+                persona.id: await self.generate_persona_text(persona, prompt_config)
+                for persona in personas_by_id
+            }
+
+        # Threads overlap work because torch/numpy release the GIL;
+        # each worker holds its own embedder model.
+        loop = asyncio.get_running_loop()
+        executor = (
+            ThreadPoolExecutor(max_workers=self.config.parallel)
+            if self.config.parallel > 1 else None
+        )
+
+        async def run_all(fn, args_list: List[Tuple]) -> List[Any]:
+            if executor is None:
+                return [fn(*args) for args in args_list]
+            return list(await asyncio.gather(*(
+                loop.run_in_executor(executor, fn, *args) for args in args_list
+            )))
+
+        try:
+            # One model load and one persona / POI batch per embedder,
+            # sliced back per prompt / formatter
+            embedded = dict(zip(
                 self.config.embedders,
-            )
-        ):
-            logger.info(
-                f"[{i+1}/{total_combinations}] "
-                f"Prompt={prompt_name}, Formatter={formatter_name}, Embedder={embedder_name}"
-            )
+                await run_all(self._embed_all_texts, [
+                    (embedder_name, persona_texts_by_prompt, review_texts)
+                    for embedder_name in self.config.embedders
+                ]),
+            ))
+
+            def run_combination(
+                i: int, prompt_name: str, formatter_name: str, embedder_name: str
+            ) -> ExperimentResult:
+                logger.info(
+                    f"[{i}/{total_combinations}] "
+                    f"Prompt={prompt_name}, Formatter={formatter_name}, Embedder={embedder_name}"
+                )
+                persona_matrices, poi_matrices = embedded[embedder_name]
+                return self._run_single_combination(
+                    prompt_name,
+                    formatter_name,
+                    embedder_name,
+                    persona_texts_by_prompt[prompt_name],
+                    review_texts[formatter_name],
+                    persona_matrices[prompt_name],
+                    poi_matrices[formatter_name],
+                )
 
-            result = self._run_single_combination(
-                prompt_name, formatter_name, embedder_name
-            )
-            results.results.append(result)
+            combinations = [
+                (prompt_config.name, formatter_config.name, embedder_name)
+                for prompt_config in prompt_configs
+                for formatter_config in formatter_configs
+                for embedder_name in self.config.embedders
+            ]
+            results.results.extend(await run_all(run_combination, [
+                (i, *combination) for i, combination in enumerate(combinations, 1)
+            ]))
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         # Save results
         if self.config.output_dir:
@@ -490,47 +703,68 @@ class ExperimentRunner:
 
         return results
 
-    def _run_single_combination(
-        self, prompt_name: str, formatter_name: str, embedder_name: str
-    ) -> ExperimentResult:
-        """Run a single experiment combination."""
-        prompt_config = PROMPT_REGISTRY[prompt_name]
-        formatter_config = FORMATTER_REGISTRY[formatter_name]
+    def _embed_all_texts(
+        self,
+        embedder_name: str,
+        persona_texts_by_prompt: Dict[str, Dict[str, str]],
+        review_texts: Dict[str, Dict[str, str]],
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """Embed every prompt's persona texts and every formatter's reviews with one embedder.
+
+        All persona texts go through a single embed call and all review texts
+        through another; the matrices are split back per prompt / formatter.
+        """
+        logger.info(f"Embedding texts with {embedder_name}")
+        # Model loads lazily on the first cache miss
         embedder = create_embedder(embedder_name)
-        embedder.load_model()
 
-        # Generate persona texts and embeddings
-        persona_texts: Dict[str, str] = {}
-        persona_embeddings: Dict[str, List[float]] = {}
-
-        for persona in self.personas:
-            text = self.generate_persona_text(persona, prompt_config)
-            persona_texts[persona.id] = text
-            persona_embeddings[persona.id] = embedder.embed(text, EmbeddingTaskType.QUERY)
+        persona_ids = [p.id for p in self.personas]
+        P_all = self._embed_texts(
+            embedder,
+            embedder_name,
+            [texts[pid] for texts in persona_texts_by_prompt.values() for pid in persona_ids],
+            EmbeddingTaskType.QUERY,
+        )
 
-        # Format reviews and generate embeddings
-        formatted_reviews: Dict[str, str] = {}
-        poi_embeddings: Dict[str, List[float]] = {}
+        poi_ids = [poi.id for poi in self.reviews.pois]
+        Q_all = self._embed_texts(
+            embedder,
+            embedder_name,
+            [texts[pid] for texts in review_texts.values() for pid in poi_ids],
+            EmbeddingTaskType.DOCUMENT,
+        )
 
-        for poi in self.reviews.pois:
-            text = self.format_review_text(poi, formatter_config)
-            formatted_reviews[poi.id] = text
-            poi_embeddings[poi.id] = embedder.embed(text, EmbeddingTaskType.DOCUMENT)
+        return (
+            dict(zip(persona_texts_by_prompt, np.split(P_all, len(persona_texts_by_prompt)))),
+            dict(zip(review_texts, np.split(Q_all, len(review_texts)))),
+        )
 
-        # Calculate all similarity scores
-        similarity_scores: List[SimilarityScore] = []
-        for persona in self.personas:
-            persona_emb = persona_embeddings[persona.id]
-            for poi in self.reviews.pois:
-                poi_emb = poi_embeddings[poi.id]
-                sim = self.metrics_calculator.cosine_similarity(persona_emb, poi_emb)
-                is_related = poi.id in persona.related_poi_ids
-                similarity_scores.append(SimilarityScore(
-                    persona_id=persona.id,
-                    poi_id=poi.id,
-                    similarity=sim,
-                    is_related=is_related,
-                ))
+    def _run_single_combination(
+        self,
+        prompt_name: str,
+        formatter_name: str,
+        embedder_name: str,
+        persona_texts: Dict[str, str],
+        formatted_reviews: Dict[str, str],
+        P: np.ndarray,
+        Q: np.ndarray,
+    ) -> ExperimentResult:
+        """Score a single experiment combination on pre-computed embeddings."""
+        persona_ids = [p.id for p in self.personas]
+        poi_ids = [poi.id for poi in self.reviews.pois]
+
+        # Calculate all similarity scores at once (S = P @ Q.T)
+        S = self.metrics_calculator.similarity_matrix(P, Q)
+
+        poi_id_array = np.asarray(poi_ids, dtype=object)
+        similarity_scores = SimilarityMatrix(
+            scores=S,
+            persona_ids=persona_ids,
+            poi_ids=poi_ids,
+            is_related=np.stack([
+                np.isin(poi_id_array, persona.related_poi_ids) for persona in self.personas
+            ]) if self.personas else np.zeros(S.shape, dtype=bool),
+        )
 
         # Build persona labels for metrics
         persona_labels: Dict[str, Tuple[List[str], List[str]]] = {}
@@ -545,9 +779,12 @@ class ExperimentRunner:
             prompt_name=prompt_name,
             formatter_name=formatter_name,
             embedder_name=embedder_name,
-            persona_embeddings=persona_embeddings,
-            poi_embeddings=poi_embeddings,
+            P=P,
+            persona_ids=persona_ids,
+            Q=Q,
+            poi_ids=poi_ids,
             persona_labels=persona_labels,
+            similarity_matrix=S,
         )
 
         return ExperimentResult(
@@ -556,8 +793,8 @@ class ExperimentRunner:
             embedder_name=embedder_name,
             metrics=metrics,
             similarity_scores=similarity_scores,
-            persona_embeddings=persona_embeddings if self.config.save_embeddings else None,
-            poi_embeddings=poi_embeddings if self.config.save_embeddings else None,
+            persona_embeddings=(P, persona_ids) if self.config.save_embeddings else None,
+            poi_embeddings=(Q, poi_ids) if self.config.save_embeddings else None,
             generated_personas=persona_texts,
             formatted_reviews=formatted_reviews,
         )
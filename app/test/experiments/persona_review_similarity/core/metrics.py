@@ -8,9 +8,11 @@ Provides:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+from .cosine_numba import cosine_matrix, has_optimized_blas
+
 
 @dataclass
 class ExperimentMetrics:
@@ -57,30 +59,52 @@ class MetricsCalculator:
         similarities: List[float],
     ) -> Tuple[float, float]:
         """Calculate mean and std of similarities."""
-        if not similarities:
+        if len(similarities) == 0:
             return 0.0, 0.0
         return float(np.mean(similarities)), float(np.std(similarities))
 
     @staticmethod
+    def top_k_indices(sims: np.ndarray, k: int) -> np.ndarray:
+        """Column indices of the k largest similarities, highest first."""
+        k = min(k, len(sims))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        top = np.argpartition(sims, -k)[-k:]
+        return top[np.argsort(-sims[top], kind="stable")]
+
+    @staticmethod
+    def top_k_indices_rows(S: np.ndarray, k: int) -> np.ndarray:
+        """[N, k] column indices of each row's k largest values, highest first."""
+        k = min(k, S.shape[1]) if S.ndim == 2 else 0
+        if k <= 0:
+            return np.empty((len(S), 0), dtype=np.intp)
+        neg = -S
+        top = np.argpartition(neg, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(neg, top, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(top, order, axis=1)
+
+    @classmethod
     def top_k_accuracy(
-        similarities: List[Tuple[str, float]],  # (poi_id, similarity)
-        related_poi_ids: List[str],
+        cls,
+        sims: np.ndarray,  # similarity to every POI column
+        related_cols: np.ndarray,  # column indices of related POIs
         k: int,
+        num_related: Optional[int] = None,
     ) -> float:
         """
         Calculate Top-K accuracy.
         Returns: proportion of related POIs in top K results.
+
+        num_related overrides the denominator when the persona lists related
+        POIs that are not columns of sims (defaults to len(related_cols)).
         """
-        if not similarities or not related_poi_ids:
+        if num_related is None:
+            num_related = len(related_cols)
+        if len(sims) == 0 or num_related == 0:
             return 0.0
 
-        # Sort by similarity descending
-        sorted_sims = sorted(similarities, key=lambda x: x[1], reverse=True)
-        top_k_ids = [poi_id for poi_id, _ in sorted_sims[:k]]
-
-        # Count related POIs in top K
-        hits = sum(1 for poi_id in top_k_ids if poi_id in related_poi_ids)
-        return hits / min(k, len(related_poi_ids))
+        hits = np.isin(cls.top_k_indices(sims, k), related_cols).sum()
+        return float(hits) / min(k, num_related)
 
     @staticmethod
     def discrimination_score(
@@ -91,77 +115,124 @@ class MetricsCalculator:
         Calculate discrimination score.
         Higher is better - means better separation between related and unrelated.
         """
-        if not related_similarities or not unrelated_similarities:
+        if len(related_similarities) == 0 or len(unrelated_similarities) == 0:
             return 0.0
 
         avg_related = np.mean(related_similarities)
         avg_unrelated = np.mean(unrelated_similarities)
         return float(avg_related - avg_unrelated)
 
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """Return a row-normalized float32 copy of an [N, D] embedding matrix."""
+        matrix = np.array(matrix, dtype=np.float32)
+        if matrix.size:
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+        return matrix
+
+    def similarity_matrix(self, P: np.ndarray, Q: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of every persona against every POI.
+
+        Args:
+            P: [N, D] persona embeddings
+            Q: [M, D] POI embeddings
+
+        Returns:
+            [N, M] matrix S where S[i, j] is the similarity of P[i] and Q[j]
+        """
+        if not (np.size(P) and np.size(Q)):
+            return np.zeros((len(P), len(Q)), dtype=np.float32)
+        P = self._normalize_rows(P)
+        Q = self._normalize_rows(Q)
+        # Without an optimized BLAS, numpy's matmul is a naive loop; prefer the numba kernel
+        if cosine_matrix is not None and not has_optimized_blas():
+            S = np.empty((P.shape[0], Q.shape[0]), dtype=np.float32)
+            cosine_matrix(P, Q, S)
+            return S
+        return P @ Q.T
+
     def compute_metrics(
         self,
         prompt_name: str,
         formatter_name: str,
         embedder_name: str,
-        persona_embeddings: Dict[str, List[float]],  # persona_id -> embedding
-        poi_embeddings: Dict[str, List[float]],  # poi_id -> embedding
+        P: np.ndarray,  # [N, D] persona embeddings
+        persona_ids: List[str],  # row ids of P
+        Q: np.ndarray,  # [M, D] POI embeddings
+        poi_ids: List[str],  # row ids of Q
         persona_labels: Dict[str, Tuple[List[str], List[str]]],  # persona_id -> (related, unrelated)
+        similarity_matrix: Optional[np.ndarray] = None,
     ) -> ExperimentMetrics:
         """
         Compute all metrics for one experiment configuration.
 
+        All persona x POI cosine similarities are computed at once as
+        S = P @ Q.T over row-normalized embedding matrices.
+
         Args:
             prompt_name: Name of the prompt used
             formatter_name: Name of the formatter used
             embedder_name: Name of the embedder used
-            persona_embeddings: Dict mapping persona_id to embedding
-            poi_embeddings: Dict mapping poi_id to embedding
+            P: Persona embedding matrix, one row per persona_ids entry
+            persona_ids: Persona id of each row of P
+            Q: POI embedding matrix, one row per poi_ids entry
+            poi_ids: POI id of each row of Q
             persona_labels: Dict mapping persona_id to (related_poi_ids, unrelated_poi_ids)
+            similarity_matrix: Precomputed S from similarity_matrix(P, Q);
+                computed if omitted
         """
-        all_related_sims = []
-        all_unrelated_sims = []
+        S = similarity_matrix if similarity_matrix is not None else self.similarity_matrix(P, Q)
+        poi_idx = {poi_id: j for j, poi_id in enumerate(poi_ids)}
+        # Top-10 ranking of every row in one pass; top-3/5 are prefixes of it
+        ranked = self.top_k_indices_rows(S, 10)
+
+        related_chunks: List[np.ndarray] = []
+        unrelated_chunks: List[np.ndarray] = []
         all_top_3 = []
         all_top_5 = []
         all_top_10 = []
         per_persona_scores = {}
 
-        for persona_id, persona_emb in persona_embeddings.items():
+        for row, persona_id in enumerate(persona_ids):
             if persona_id not in persona_labels:
                 continue
 
             related_ids, unrelated_ids = persona_labels[persona_id]
 
-            # Calculate similarities for this persona
-            related_sims = []
-            unrelated_sims = []
-            all_sims = []  # For top-k calculation
-
-            for poi_id, poi_emb in poi_embeddings.items():
-                sim = self.cosine_similarity(persona_emb, poi_emb)
-                all_sims.append((poi_id, sim))
+            # Column indices of labelled POIs (a POI labelled both ways counts as related)
+            related_cols = np.unique(np.fromiter(
+                (poi_idx[i] for i in related_ids if i in poi_idx), dtype=np.int64
+            ))
+            unrelated_cols = np.setdiff1d(np.fromiter(
+                (poi_idx[i] for i in unrelated_ids if i in poi_idx), dtype=np.int64
+            ), related_cols)
 
-                if poi_id in related_ids:
-                    related_sims.append(sim)
-                elif poi_id in unrelated_ids:
-                    unrelated_sims.append(sim)
+            sims = S[row]
+            related_sims = sims[related_cols].astype(np.float64)
+            unrelated_sims = sims[unrelated_cols].astype(np.float64)
 
-            all_related_sims.extend(related_sims)
-            all_unrelated_sims.extend(unrelated_sims)
+            related_chunks.append(related_sims)
+            unrelated_chunks.append(unrelated_sims)
 
             # Top-K for this persona
-            if all_sims and related_ids:
-                all_top_3.append(self.top_k_accuracy(all_sims, related_ids, 3))
-                all_top_5.append(self.top_k_accuracy(all_sims, related_ids, 5))
-                all_top_10.append(self.top_k_accuracy(all_sims, related_ids, 10))
+            if poi_ids and related_ids:
+                is_hit = np.isin(ranked[row], related_cols)
+                num_related = len(related_ids)
+                all_top_3.append(float(is_hit[:3].sum()) / min(3, num_related))
+                all_top_5.append(float(is_hit[:5].sum()) / min(5, num_related))
+                all_top_10.append(float(is_hit[:10].sum()) / min(10, num_related))
 
             # Store per-persona scores
             per_persona_scores[persona_id] = {
-                "avg_related": float(np.mean(related_sims)) if related_sims else 0.0,
-                "avg_unrelated": float(np.mean(unrelated_sims)) if unrelated_sims else 0.0,
+                "avg_related": float(related_sims.mean()) if related_sims.size else 0.0,
+                "avg_unrelated": float(unrelated_sims.mean()) if unrelated_sims.size else 0.0,
                 "discrimination": self.discrimination_score(related_sims, unrelated_sims),
             }
 
-        # Aggregate metrics
+        # Aggregate metrics over all personas in one pass
+        all_related_sims = np.concatenate(related_chunks) if related_chunks else np.empty(0)
+        all_unrelated_sims = np.concatenate(unrelated_chunks) if unrelated_chunks else np.empty(0)
         avg_related, std_related = self.calculate_similarity_stats(all_related_sims)
         avg_unrelated, std_unrelated = self.calculate_similarity_stats(all_unrelated_sims)
 
@@ -8,8 +8,8 @@ Each registry allows dynamic registration of:
 """
 
 from .prompts import PROMPT_REGISTRY, register_prompt, PromptConfig
-from .formatters import FORMATTER_REGISTRY, register_formatter, FormatterConfig
-from .embedders import EMBEDDER_REGISTRY, register_embedder, EmbedderConfig
+from .formatters import FORMATTER_REGISTRY, register_formatter, FormatterConfig, format_batch
+from .embedders import EMBEDDER_REGISTRY, register_embedder, register_st_embedder, register_onnx_variant, EmbedderConfig
 
 __all__ = [
     "PROMPT_REGISTRY",
@@ -18,7 +18,10 @@ __all__ = [
     "FORMATTER_REGISTRY",
     "register_formatter",
     "FormatterConfig",
+    "format_batch",
     "EMBEDDER_REGISTRY",
     "register_embedder",
+    "register_st_embedder",
+    "register_onnx_variant",
     "EmbedderConfig",
 ]
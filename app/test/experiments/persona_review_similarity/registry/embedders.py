@@ -1,16 +1,21 @@
 """
 Embedder Registry for Embedding Models.
 
-Register new embedders using the @register_embedder decorator:
+SentenceTransformers models are registered with a single call:
 
-    @register_embedder("E5_NewModel", "model-name-on-huggingface")
+    register_st_embedder("E6_NewModel", "model-name-on-huggingface", dimension=768)
+
+Embedders with custom inference code use the @register_embedder decorator:
+
+    @register_embedder("E6_NewModel", "model-name-on-huggingface")
     class NewModelEmbedder(BaseExperimentEmbedder):
         ...
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Type
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 import numpy as np
 
 from app.core.Agents.Poi.VectorDB.EmbeddingPipeline.BaseEmbeddingPipeline import EmbeddingTaskType
@@ -43,6 +48,7 @@ def register_embedder(
             dimension=dimension,
             embedder_class=cls,
         )
+        cls.dimension = dimension
         return cls
 
     return decorator
@@ -51,6 +57,12 @@ def register_embedder(
 class BaseExperimentEmbedder(ABC):
     """Abstract base class for experiment embedders."""
 
+    # True when embed/embed_batch return L2-normalized vectors, so cosine is a plain dot
+    # product. Subclasses that return raw vectors must set this to False.
+    normalized: bool = True
+    # Output width, set by register_embedder; None skips the width check
+    dimension: Optional[int] = None
+
     def __init__(self, model_name: str):
         self.model_name = model_name
         self._model = None
@@ -61,114 +73,367 @@ class BaseExperimentEmbedder(ABC):
         pass
 
     @abstractmethod
-    def embed(self, text: str, task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> List[float]:
-        """Embed a single text string."""
+    def embed(self, text: str, task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> np.ndarray:
+        """Embed a single text string; returns a [D] float32 array."""
         pass
 
     @abstractmethod
-    def embed_batch(self, texts: List[str], task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> List[List[float]]:
-        """Embed multiple text strings."""
+    def embed_batch(self, texts: List[str], task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> np.ndarray:
+        """Embed multiple text strings in one call; returns an [N, D] float32 array."""
         pass
 
+    def _check_batch_shape(self, embeddings: np.ndarray, num_texts: int) -> np.ndarray:
+        """Reject batch output that is not [num_texts, dimension] instead of scoring garbage."""
+        if embeddings.ndim != 2 or embeddings.shape[0] != num_texts or (
+            self.dimension is not None and embeddings.shape[1] != self.dimension
+        ):
+            raise ValueError(
+                f"{type(self).__name__} returned shape {embeddings.shape}, "
+                f"expected ({num_texts}, {self.dimension or 'D'})"
+            )
+        return embeddings
+
+    def embed_list(self, text: str, task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> List[float]:
+        """embed() as a Python list, for callers that still expect List[float]."""
+        return self.embed(text, task_type).tolist()
+
+    def embed_batch_list(
+        self, texts: List[str], task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY
+    ) -> List[List[float]]:
+        """embed_batch() as nested Python lists, for callers that still expect them."""
+        return self.embed_batch(texts, task_type).tolist()
+
     def cosine_similarity(
         self, embedding1: List[float], embedding2: List[float]
     ) -> float:
         """Calculate cosine similarity between two embeddings."""
-        a = np.array(embedding1)
-        b = np.array(embedding2)
-        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+        a = np.asarray(embedding1, dtype=np.float32)
+        b = np.asarray(embedding2, dtype=np.float32)
+        if self.normalized:
+            return float(np.dot(a, b))
+        denom = np.sqrt(np.vdot(a, a) * np.vdot(b, b))
+        if denom == 0:
+            return 0.0
+        return float(np.dot(a, b) / denom)
+
+    @staticmethod
+    def _normalize(v: np.ndarray) -> np.ndarray:
+        """L2-normalize vectors along the last axis in place (zero vectors stay zero)."""
+        norms = np.linalg.norm(v, axis=-1, keepdims=True)
+        v /= np.where(norms == 0, 1, norms)
+        return v
+
+    @classmethod
+    def cosine_matrix(cls, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row of A [N, D] against every row of B [M, D].
+
+        Rows are normalized once on float32 copies, then one A @ B.T matmul
+        replaces N x M cosine_similarity calls.
+        """
+        A = cls._normalize(np.array(A, dtype=np.float32, order="C"))
+        B = cls._normalize(np.array(B, dtype=np.float32, order="C"))
+        return A @ B.T
+
+    def similarity_matrix(self, P: np.ndarray, Q: np.ndarray) -> np.ndarray:
+        """Cosine similarity matrix for this embedder's outputs (a plain dot product when normalized)."""
+        if not self.normalized:
+            return self.cosine_matrix(P, Q)
+        return np.asarray(P, dtype=np.float32) @ np.asarray(Q, dtype=np.float32).T
 
 
 # ============================================================
 # SentenceTransformer-based Embedders
 # ============================================================
-class SentenceTransformerEmbedder(BaseExperimentEmbedder):
-    """Embedder using SentenceTransformers library."""
+# Loaded models shared by every embedder instance in the process, keyed by
+# (model_name, constructor kwargs), so a sweep loads each model's weights once.
+_MODEL_CACHE: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
 
-    def load_model(self) -> None:
-        from sentence_transformers import SentenceTransformer
 
-        self._model = SentenceTransformer(self.model_name)
+def _resolve_device() -> str:
+    """First visible CUDA device (CUDA_VISIBLE_DEVICES remaps it to cuda:0), else CPU."""
+    import torch
+
+    return "cuda:0" if torch.cuda.is_available() else "cpu"
+
+
+_TORCH_THREADS_CONFIGURED = False
+
+
+def _configure_torch_threads() -> None:
+    """Set torch CPU thread pools once per process.
+
+    EMBEDDER_NUM_THREADS (default: all cores) and EMBEDDER_NUM_INTEROP_THREADS
+    (default: 1) override the defaults on shared hosts.
+    """
+    global _TORCH_THREADS_CONFIGURED
+    if _TORCH_THREADS_CONFIGURED:
+        return
+    import torch
+
+    torch.set_num_threads(int(os.environ.get("EMBEDDER_NUM_THREADS") or os.cpu_count() or 1))
+    try:
+        torch.set_num_interop_threads(int(os.environ.get("EMBEDDER_NUM_INTEROP_THREADS") or 1))
+    except RuntimeError:
+        # Only settable before the first inter-op parallel work in the process
+        pass
+    _TORCH_THREADS_CONFIGURED = True
+
+
+def _to_half_precision(model: Any) -> Any:
+    """Cast a CUDA-resident model to bf16 (Ampere+) or fp16; CPU models stay fp32."""
+    import torch
+
+    if not torch.cuda.is_available() or model.device.type != "cuda":
+        return model
+    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    try:
+        return model.to(dtype=dtype)
+    except (RuntimeError, TypeError):
+        # Remote-code models (e.g. Jina) may not support the cast; keep fp32
+        return model
+
 
-    def embed(self, text: str, task_type: EmbeddingTaskType) -> List[float]:
+class SentenceTransformerEmbedder(BaseExperimentEmbedder):
+    """Embedder using SentenceTransformers library.
+
+    Model-specific behaviour is data, not subclass code:
+    prefix_fn(task_type) returns a prefix prepended to every text,
+    encode_kwargs_fn(task_type) returns extra encode() kwargs, and
+    model_kwargs are passed to the SentenceTransformer constructor.
+    """
+
+    # Whole lists go to encode() in one call so SentenceTransformers can sort
+    # them by length across a large batch.
+    encode_batch_size: int = 1024
+    # Run inference in bf16/fp16 when the model sits on a CUDA device
+    half_precision: bool = True
+    # Explicit torch device; None picks the first visible GPU, else CPU
+    device: Optional[str] = None
+    # Sort inputs by length before encode() so each batch pads to a similar
+    # length; some task/prompt kwargs paths skip SentenceTransformers' own sort
+    sort_by_length: bool = True
+    # Split large embed_batch calls across every visible GPU
+    multi_gpu: bool = False
+    prefix_fn: Optional[Callable[[EmbeddingTaskType], str]] = None
+    encode_kwargs_fn: Optional[Callable[[EmbeddingTaskType], Dict[str, Any]]] = None
+    model_kwargs: Dict[str, Any] = {}
+
+    def load_model(self) -> None:
+        key = (self.model_name, tuple(sorted(self.model_kwargs.items())))
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+
+            _configure_torch_threads()
+
+            model = SentenceTransformer(
+                self.model_name, device=self.device or _resolve_device(), **self.model_kwargs
+            )
+            if self.half_precision:
+                model = _to_half_precision(model)
+            _MODEL_CACHE[key] = model
+        self._model = model
+
+    def _encode(self, inputs: Union[str, List[str]], **kwargs) -> np.ndarray:
+        """model.encode() with the shared throughput settings, as float32."""
         if self._model is None:
             self.load_model()
-        return self._model.encode(text).tolist()
+        import torch
+
+        with torch.inference_mode():
+            embeddings = self._model.encode(
+                inputs,
+                batch_size=self.encode_batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                **kwargs,
+            )
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _prepare(
+        self, texts: List[str], task_type: EmbeddingTaskType
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Apply the task prefix and collect task-specific encode kwargs."""
+        prefix_fn = type(self).prefix_fn
+        if prefix_fn is not None:
+            prefix = prefix_fn(task_type)
+            texts = [f"{prefix}{t}" for t in texts]
+        kwargs_fn = type(self).encode_kwargs_fn
+        return texts, (kwargs_fn(task_type) if kwargs_fn is not None else {})
+
+    def embed(self, text: str, task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> np.ndarray:
+        return self.embed_batch([text], task_type)[0]
+
+    def _token_lengths(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Token counts from the model's fast tokenizer, or None if unavailable."""
+        tokenizer = getattr(self._model, "tokenizer", None)
+        if tokenizer is None or not getattr(tokenizer, "is_fast", False):
+            return None
+        try:
+            encoded = tokenizer(texts, add_special_tokens=False, return_length=True)
+        except (TypeError, ValueError):
+            return None
+        return np.asarray(encoded["length"], dtype=np.int64)
+
+    def _length_order(self, texts: List[str]) -> np.ndarray:
+        """Indices that sort texts from longest to shortest.
+
+        Uses token counts when a fast tokenizer is available, since the
+        char/token ratio of Korean text differs a lot between tokenizers;
+        falls back to character counts otherwise.
+        """
+        if self._model is None:
+            self.load_model()
+        lengths = self._token_lengths(texts)
+        if lengths is None:
+            lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        return np.argsort(-lengths, kind="stable")
+
+    def embed_batch(self, texts: List[str], task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimension or 0), dtype=np.float32)
+        if self.multi_gpu:
+            embeddings = self.embed_batch_parallel(texts, task_type)
+        else:
+            embeddings = self._embed_batch_local(texts, task_type)
+        return self._check_batch_shape(embeddings, len(texts))
+
+    def embed_batch_parallel(
+        self,
+        texts: List[str],
+        task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY,
+        devices: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """Embed with one model replica per device via encode_multi_process.
+
+        devices defaults to every visible CUDA device. Small inputs stay on the
+        single-process path, where worker start-up and IPC would dominate.
+        """
+        if devices is None:
+            import torch
+
+            devices = [f"cuda:{i}" for i in range(torch.cuda.device_count())]
+        if len(devices) < 2 or len(texts) <= 2 * self.encode_batch_size * len(devices):
+            return self._embed_batch_local(texts, task_type)
 
-    def embed_batch(self, texts: List[str], task_type: EmbeddingTaskType) -> List[List[float]]:
         if self._model is None:
             self.load_model()
-        embeddings = self._model.encode(texts)
-        return [emb.tolist() for emb in embeddings]
+        texts, kwargs = self._prepare(texts, task_type)
+        pool = self._model.start_multi_process_pool(target_devices=devices)
+        try:
+            embeddings = self._model.encode_multi_process(
+                texts,
+                pool,
+                batch_size=self.encode_batch_size,
+                normalize_embeddings=True,
+                **kwargs,
+            )
+        finally:
+            self._model.stop_multi_process_pool(pool)
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _embed_batch_local(self, texts: List[str], task_type: EmbeddingTaskType) -> np.ndarray:
+        texts, kwargs = self._prepare(texts, task_type)
+        if not self.sort_by_length or len(texts) < 2:
+            return self._encode(texts, **kwargs)
+
+        order = self._length_order(texts)
+        sorted_embeddings = self._encode([texts[i] for i in order], **kwargs)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+
+
+def register_st_embedder(
+    name: str,
+    model_name: str,
+    description: str = "",
+    dimension: int = 384,
+    *,
+    class_name: Optional[str] = None,
+    prefix_fn: Optional[Callable[[EmbeddingTaskType], str]] = None,
+    encode_kwargs_fn: Optional[Callable[[EmbeddingTaskType], Dict[str, Any]]] = None,
+    model_kwargs: Optional[Dict[str, Any]] = None,
+) -> Type[SentenceTransformerEmbedder]:
+    """Build and register a SentenceTransformerEmbedder subclass in one call."""
+    attrs: Dict[str, Any] = {}
+    if prefix_fn is not None:
+        attrs["prefix_fn"] = staticmethod(prefix_fn)
+    if encode_kwargs_fn is not None:
+        attrs["encode_kwargs_fn"] = staticmethod(encode_kwargs_fn)
+    if model_kwargs:
+        attrs["model_kwargs"] = dict(model_kwargs)
+    cls = type(class_name or f"{name}Embedder", (SentenceTransformerEmbedder,), attrs)
+    return register_embedder(name, model_name, description, dimension)(cls)
+
+
+def register_onnx_variant(name: str) -> Type[SentenceTransformerEmbedder]:
+    """Register "<name>_ONNX": the same model served through ONNX Runtime.
+
+    Uses the sentence-transformers ONNX backend, which keeps each model's own
+    pooling/normalization modules and exports the weights on first load.
+    Requires the optional optimum[onnxruntime] extra, imported only on load.
+    """
+    config = EMBEDDER_REGISTRY[name]
+    base = config.embedder_class
+    cls = type(f"{base.__name__}ONNX", (base,), {
+        "model_kwargs": {**base.model_kwargs, "backend": "onnx"},
+        # ONNX Runtime picks its own precision; torch dtype casts do not apply
+        "half_precision": False,
+    })
+    return register_embedder(
+        f"{name}_ONNX", config.model_name, f"{config.description}, ONNX Runtime", config.dimension
+    )(cls)
+
+
+def _e5_prefix(task_type: EmbeddingTaskType) -> str:
+    if task_type == EmbeddingTaskType.DOCUMENT:
+        return "passage: "
+    return "query: "
+
+
+def _jina_task_kwargs(task_type: EmbeddingTaskType) -> Dict[str, Any]:
+    jina_task = "retrieval.query" if task_type == EmbeddingTaskType.QUERY else "retrieval.passage"
+    return {"task": jina_task, "prompt_name": jina_task}
 
 
-# ============================================================
 # E1: dragonkue/bge-m3-ko
-# ============================================================
-@register_embedder(
-    name="E1_Dragonkue_BgeM3Ko",
-    model_name="dragonkue/bge-m3-ko",
-    description="1024차원",
-    dimension=1024,
+DragonkueEmbedder = register_st_embedder(
+    "E1_Dragonkue_BgeM3Ko", "dragonkue/bge-m3-ko",
+    description="1024차원", dimension=1024, class_name="DragonkueEmbedder",
 )
-class DragonkueEmbedder(SentenceTransformerEmbedder):
-    pass
 
-
-# ============================================================
 # E2: ibm-granite/granite-embedding-278m-multilingual
-# ============================================================
-@register_embedder(
-    name="E2_IBM_Granite",
-    model_name="ibm-granite/granite-embedding-278m-multilingual",
-    description="다국어 지원, 768차원",
-    dimension=768,
+GraniteEmbedder = register_st_embedder(
+    "E2_IBM_Granite", "ibm-granite/granite-embedding-278m-multilingual",
+    description="다국어 지원, 768차원", dimension=768, class_name="GraniteEmbedder",
 )
-class GraniteEmbedder(SentenceTransformerEmbedder):
-    pass
 
-
-# ============================================================
 # E3: ko-sroberta-multitask (한국어 특화)
-# ============================================================
-@register_embedder(
-    name="E3_KoSRoBERTa",
-    model_name="jhgan/ko-sroberta-multitask",
-    description="한국어 특화, 768차원",
-    dimension=768,
+KoSRoBERTaEmbedder = register_st_embedder(
+    "E3_KoSRoBERTa", "jhgan/ko-sroberta-multitask",
+    description="한국어 특화, 768차원", dimension=768, class_name="KoSRoBERTaEmbedder",
 )
-class KoSRoBERTaEmbedder(SentenceTransformerEmbedder):
-    pass
-
 
-# ============================================================
-# E4: multilingual-e5-large (고성능 다국어)
-# ============================================================
-@register_embedder(
-    name="E4_E5Large",
-    model_name="intfloat/multilingual-e5-large",
-    description="고성능 다국어, 1024차원",
-    dimension=1024,
+# E4: multilingual-e5-large (고성능 다국어) - query/passage 접두사 필요
+E5LargeEmbedder = register_st_embedder(
+    "E4_E5Large", "intfloat/multilingual-e5-large",
+    description="고성능 다국어, 1024차원", dimension=1024, class_name="E5LargeEmbedder",
+    prefix_fn=_e5_prefix,
 )
-class E5LargeEmbedder(SentenceTransformerEmbedder):
-    def _get_prefix(self, task_type: EmbeddingTaskType) -> str:
-        if task_type == EmbeddingTaskType.DOCUMENT:
-            return "passage: "
-        return "query: "
 
-    def embed(self, text: str, task_type: EmbeddingTaskType) -> List[float]:
-        if self._model is None:
-            self.load_model()
-        prefix = self._get_prefix(task_type)
-        return self._model.encode(f"{prefix}{text}").tolist()
+# E5: jina-embeddings-v3 (고성능 다국어) - task 별 LoRA 어댑터 선택
+JinaEmbedder = register_st_embedder(
+    "E5_Jina", "jinaai/jina-embeddings-v3",
+    description="고성능 다국어, 1024차원", dimension=1024, class_name="JinaEmbedder",
+    encode_kwargs_fn=_jina_task_kwargs,
+    model_kwargs={"trust_remote_code": True},
+)
 
-    def embed_batch(self, texts: List[str], task_type: EmbeddingTaskType) -> List[List[float]]:
-        if self._model is None:
-            self.load_model()
-        prefix = self._get_prefix(task_type)
-        prefixed_texts = [f"{prefix}{t}" for t in texts]
-        embeddings = self._model.encode(prefixed_texts)
-        return [emb.tolist() for emb in embeddings]
+# E1-E4 ONNX Runtime 변형 (A/B 비교용). Jina는 remote code라 PyTorch 경로만 사용
+for _name in ("E1_Dragonkue_BgeM3Ko", "E2_IBM_Granite", "E3_KoSRoBERTa", "E4_E5Large"):
+    register_onnx_variant(_name)
 
 
 def get_embedder(name: str) -> Optional[EmbedderConfig]:
@@ -187,47 +452,3 @@ def create_embedder(name: str) -> Optional[BaseExperimentEmbedder]:
 def list_embedders() -> List[str]:
     """List all registered embedder names."""
     return list(EMBEDDER_REGISTRY.keys())
-
-
-# ============================================================
-# E5: jina-embeddings-v3 (고성능 다국어)
-# ============================================================
-@register_embedder(
-    name="E5_Jina",
-    model_name="jinaai/jina-embeddings-v3",
-    description="고성능 다국어, 1024차원",
-    dimension=1024,
-)
-class JinaEmbedder(SentenceTransformerEmbedder):
-    def load_model(self) -> None:
-        from sentence_transformers import SentenceTransformer
-
-        self._model = SentenceTransformer(self.model_name, trust_remote_code=True)
-
-    def _get_jina_task(self, task_type: EmbeddingTaskType) -> str:
-        if task_type == EmbeddingTaskType.QUERY:
-            return "retrieval.query"
-        return "retrieval.passage"
-
-    def embed(self, text: str, task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> List[float]:
-        if self._model is None:
-            self.load_model()
-        jina_task = self._get_jina_task(task_type)
-        embeddings = self._model.encode(
-            [text],
-            task=jina_task,
-            prompt_name=jina_task,
-        )
-        return embeddings[0].tolist()
-
-    def embed_batch(self, texts: List[str], task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY) -> List[List[float]]:
-        if self._model is None:
-            self.load_model()
-        jina_task = self._get_jina_task(task_type)
-        embeddings = self._model.encode(
-            texts,
-            task=jina_task,
-            prompt_name=jina_task,
-        )
-        return [emb[0].tolist() for emb in embeddings]
-
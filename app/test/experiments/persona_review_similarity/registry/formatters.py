@@ -9,8 +9,10 @@ Updated to use production PoiData directly:
 """
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Any
 import asyncio
+from xml.sax.saxutils import escape as xml_escape
 
 from app.core.models.PoiAgentDataclass.poi import PoiData
 
@@ -23,17 +25,28 @@ class FormatterConfig:
     description: str
     formatter: Callable[..., str]
     requires_llm: bool = False
+    # Coroutine variant for callers that already own an event loop
+    async_formatter: Optional[Callable[..., Awaitable[str]]] = None
 
 
 FORMATTER_REGISTRY: Dict[str, FormatterConfig] = {}
 
 
-def register_formatter(name: str, description: str = "", requires_llm: bool = False):
+def register_formatter(
+    name: str,
+    description: str = "",
+    requires_llm: bool = False,
+    async_formatter: Optional[Callable[..., Awaitable[str]]] = None,
+):
     """Decorator to register a new review formatter."""
 
     def decorator(func: Callable[..., str]):
         FORMATTER_REGISTRY[name] = FormatterConfig(
-            name=name, description=description, formatter=func, requires_llm=requires_llm
+            name=name,
+            description=description,
+            formatter=func,
+            requires_llm=requires_llm,
+            async_formatter=async_formatter,
         )
         return func
 
@@ -56,10 +69,7 @@ def raw_formatter(poi: PoiData, **kwargs) -> str:
 # ============================================================
 # R2a: 키워드 추출 - LLM 버전
 # ============================================================
-@register_formatter(
-    "R2_키워드추출_LLM", description="LLM으로 핵심 키워드만 추출", requires_llm=True
-)
-def keyword_formatter_llm(poi: PoiData, llm_client=None, **kwargs) -> str:
+async def keyword_formatter_llm_async(poi: PoiData, llm_client=None, **kwargs) -> str:
     """
     Extract keywords from POI using LLM.
     Output: "맛있는, 분위기 좋은, 고급"
@@ -84,16 +94,24 @@ def keyword_formatter_llm(poi: PoiData, llm_client=None, **kwargs) -> str:
     from app.core.models.LlmClientDataclass.ChatMessageDataclass import ChatMessage, MessageData
 
     messages = ChatMessage(content=[MessageData(role="user", content=prompt)])
-    response = asyncio.run(llm_client.call_llm(messages))
+    response = await llm_client.call_llm(messages)
     return response.strip()
 
+
+@register_formatter(
+    "R2_키워드추출_LLM",
+    description="LLM으로 핵심 키워드만 추출",
+    requires_llm=True,
+    async_formatter=keyword_formatter_llm_async,
+)
+def keyword_formatter_llm(poi: PoiData, llm_client=None, **kwargs) -> str:
+    """Sync wrapper; prefer format_batch for many POIs."""
+    return asyncio.run(keyword_formatter_llm_async(poi, llm_client=llm_client))
+
 # ============================================================
 # R3a: 감성+속성 - LLM 버전
 # ============================================================
-@register_formatter(
-    "R3_감성속성_LLM", description="LLM으로 감성 태그 + 속성 정리", requires_llm=True
-)
-def sentiment_attribute_formatter_llm(poi: PoiData, llm_client=None, **kwargs) -> str:
+async def sentiment_attribute_formatter_llm_async(poi: PoiData, llm_client=None, **kwargs) -> str:
     """
     Format POI with sentiment tags and attributes using LLM.
     Output: "[긍정] 맛, 분위기 / [부정] 가격 / [카테고리] restaurant"
@@ -111,10 +129,21 @@ def sentiment_attribute_formatter_llm(poi: PoiData, llm_client=None, **kwargs) -
     from app.core.models.LlmClientDataclass.ChatMessageDataclass import ChatMessage, MessageData
 
     messages = ChatMessage(content=[MessageData(role="user", content=prompt)])
-    response = asyncio.run(llm_client.call_llm(messages))
+    response = await llm_client.call_llm(messages)
 
     return response.strip()
 
+
+@register_formatter(
+    "R3_감성속성_LLM",
+    description="LLM으로 감성 태그 + 속성 정리",
+    requires_llm=True,
+    async_formatter=sentiment_attribute_formatter_llm_async,
+)
+def sentiment_attribute_formatter_llm(poi: PoiData, llm_client=None, **kwargs) -> str:
+    """Sync wrapper; prefer format_batch for many POIs."""
+    return asyncio.run(sentiment_attribute_formatter_llm_async(poi, llm_client=llm_client))
+
 # ============================================================
 # R4: 구조화 요약 (Structured Summary) - PoiData 메타데이터 활용
 # ============================================================
@@ -124,35 +153,45 @@ def structured_summary_formatter(poi: PoiData, **kwargs) -> str:
     Structured format using PoiData fields.
     Output: "restaurant | 평점 4.5 | MODERATE | 에디토리얼: ... | 리뷰: ..."
     """
+    # 필드는 한 번만 읽고 지역 변수로 사용
+    primary_type = poi.primary_type
+    category = poi.category
+    google_rating = poi.google_rating
+    user_rating_count = poi.user_rating_count
+    price_range = poi.price_range
+    price_level = poi.price_level
+    editorial_summary = poi.editorial_summary
+    generative_summary = poi.generative_summary
+    review_summary = poi.review_summary
     parts = []
 
     # 카테고리/타입
-    parts.append(poi.primary_type or poi.category.value)
+    parts.append(primary_type or category.value)
 
     # 평점
-    if poi.google_rating:
-        rating_str = f"평점 {poi.google_rating}"
-        if poi.user_rating_count:
-            rating_str += f"({poi.user_rating_count}명)"
+    if google_rating:
+        rating_str = f"평점 {google_rating}"
+        if user_rating_count:
+            rating_str += f"({user_rating_count}명)"
         parts.append(rating_str)
 
     # 가격
-    if poi.price_range:
-        parts.append(poi.price_range)
-    elif poi.price_level:
-        parts.append(poi.price_level)
+    if price_range:
+        parts.append(price_range)
+    elif price_level:
+        parts.append(price_level)
 
     # Editorial Summary
-    if poi.editorial_summary:
-        parts.append(f"소개: {poi.editorial_summary}")
+    if editorial_summary:
+        parts.append(f"소개: {editorial_summary}")
 
     # Generative Summary
-    if poi.generative_summary:
-        parts.append(f"AI요약: {poi.generative_summary}")
+    if generative_summary:
+        parts.append(f"AI요약: {generative_summary}")
 
     # Review Summary
-    if poi.review_summary:
-        parts.append(f"리뷰: {poi.review_summary}")
+    if review_summary:
+        parts.append(f"리뷰: {review_summary}")
 
     return " | ".join(parts)
 
@@ -160,66 +199,78 @@ def structured_summary_formatter(poi: PoiData, **kwargs) -> str:
 # ============================================================
 # R5: 임베딩 최적화 (Embedding Optimized) - 페르소나와 유사한 형태
 # ============================================================
+# primary_type -> 한국어 장소 유형
+_TYPE_MAP = MappingProxyType({
+    "restaurant": "음식점",
+    "cafe": "카페",
+    "tourist_attraction": "관광명소",
+    "park": "공원",
+    "museum": "박물관",
+    "shopping_mall": "쇼핑몰",
+    "hotel": "호텔",
+    "spa": "스파",
+    "hiking_area": "등산/산책 코스",
+    "amusement_park": "테마파크",
+    "amusement_center": "레저/오락 시설",
+    "bar": "바/펍",
+    "night_club": "클럽/나이트라이프",
+    "market": "전통시장",
+    "aquarium": "아쿠아리움",
+    "sports_complex": "스포츠/레저 시설",
+})
+
+# price_level -> 가격대 문장
+_PRICE_MAP = MappingProxyType({
+    "PRICE_LEVEL_FREE": "무료로 이용 가능합니다",
+    "PRICE_LEVEL_INEXPENSIVE": "가격이 저렴합니다",
+    "PRICE_LEVEL_MODERATE": "가격이 적당합니다",
+    "PRICE_LEVEL_EXPENSIVE": "가격이 비싼 편입니다",
+    "PRICE_LEVEL_VERY_EXPENSIVE": "고급 장소입니다",
+})
+
+
 @register_formatter("R5_임베딩최적화", description="페르소나 스타일과 유사한 자연어 형태")
 def embedding_optimized_formatter(poi: PoiData, **kwargs) -> str:
     """
     Natural language format optimized for embedding similarity with personas.
     Converts PoiData into persona-like descriptive text.
     """
+    primary_type = poi.primary_type
+    category = poi.category
+    google_rating = poi.google_rating
+    price_level = poi.price_level
+    editorial_summary = poi.editorial_summary
+    generative_summary = poi.generative_summary
+    review_summary = poi.review_summary
     sentences = []
 
     # 장소 유형 설명
-    type_str = poi.primary_type or poi.category.value
-    type_map = {
-        "restaurant": "음식점",
-        "cafe": "카페",
-        "tourist_attraction": "관광명소",
-        "park": "공원",
-        "museum": "박물관",
-        "shopping_mall": "쇼핑몰",
-        "hotel": "호텔",
-        "spa": "스파",
-        "hiking_area": "등산/산책 코스",
-        "amusement_park": "테마파크",
-        "amusement_center": "레저/오락 시설",
-        "bar": "바/펍",
-        "night_club": "클럽/나이트라이프",
-        "market": "전통시장",
-        "aquarium": "아쿠아리움",
-        "sports_complex": "스포츠/레저 시설",
-    }
-    korean_type = type_map.get(type_str, type_str)
+    type_str = primary_type or category.value
+    korean_type = _TYPE_MAP.get(type_str, type_str)
     sentences.append(f"{korean_type}입니다")
 
     # 평점 기반 분위기
-    if poi.google_rating:
-        if poi.google_rating >= 4.5:
+    if google_rating:
+        if google_rating >= 4.5:
             sentences.append("평점이 매우 높고 인기 있는 곳입니다")
-        elif poi.google_rating >= 4.0:
+        elif google_rating >= 4.0:
             sentences.append("평점이 좋은 곳입니다")
 
     # 가격대
-    if poi.price_level:
-        price_map = {
-            "PRICE_LEVEL_FREE": "무료로 이용 가능합니다",
-            "PRICE_LEVEL_INEXPENSIVE": "가격이 저렴합니다",
-            "PRICE_LEVEL_MODERATE": "가격이 적당합니다",
-            "PRICE_LEVEL_EXPENSIVE": "가격이 비싼 편입니다",
-            "PRICE_LEVEL_VERY_EXPENSIVE": "고급 장소입니다",
-        }
-        if poi.price_level in price_map:
-            sentences.append(price_map[poi.price_level])
+    if price_level:
+        if price_level in _PRICE_MAP:
+            sentences.append(_PRICE_MAP[price_level])
 
     # 요약 정보
-    if poi.editorial_summary:
-        sentences.append(poi.editorial_summary)
+    if editorial_summary:
+        sentences.append(editorial_summary)
 
-    if poi.generative_summary:
-        sentences.append(poi.generative_summary)
+    if generative_summary:
+        sentences.append(generative_summary)
 
     # 리뷰 요약
-    if poi.review_summary:
-        sentences.append(f"방문자 리뷰: {poi.review_summary}")
+    if review_summary:
+        sentences.append(f"방문자 리뷰: {review_summary}")
 
     return ". ".join(sentences)
 
@@ -234,53 +285,57 @@ def list_formatters() -> List[str]:
     return list(FORMATTER_REGISTRY.keys())
 
 
-# ============================================================
-# R6: XML로 구조화된 내용
-# ============================================================
-@register_formatter("R6_XML로구조화된내용", description="XML로 구조화된 내용")
-def xml_structured_content_formatter(poi: PoiData, **kwargs) -> str:
-    parts = []
-
-    # 장소명
-    if poi.name:
-        parts.append(f"<name>{poi.name}</name>")
+async def format_batch_async(
+    name: str, pois: Iterable[PoiData], llm_client=None
+) -> List[str]:
+    """
+    Format many POIs with one formatter, awaiting all LLM calls together.
+    Formatters without an async variant run inline.
+    """
+    config = FORMATTER_REGISTRY[name]
+    if config.async_formatter is None:
+        return [config.formatter(poi, llm_client=llm_client) for poi in pois]
+    return list(await asyncio.gather(
+        *(config.async_formatter(poi, llm_client=llm_client) for poi in pois)
+    ))
 
-    # 카테고리
-    if poi.primary_type:
-        parts.append(f"<primary_type>{poi.primary_type}</primary_type>")
 
-    # 타입
-    if poi.types:
-        parts.append(f"<type>{', '.join(poi.types)}</type>")
+def format_batch(name: str, pois: Iterable[PoiData], llm_client=None) -> List[str]:
+    """Sync entry point for format_batch_async: one event loop per batch, not per POI."""
+    return asyncio.run(format_batch_async(name, pois, llm_client=llm_client))
 
-    # 주소
-    if poi.address:
-        parts.append(f"<address>{poi.address}</address>")
 
-    # 평점
-    if poi.google_rating:
-        parts.append(f"<google_rating>{poi.google_rating or '정보없음'}</google_rating>")
+def _xml_elements(fields: Dict[str, Any]) -> str:
+    """Render non-empty fields as one <tag>value</tag> line each, escaping &, <, >."""
+    return "\n".join(
+        f"<{tag}>{xml_escape(str(value))}</{tag}>" for tag, value in fields.items() if value
+    )
 
-    # 리뷰 수
-    if poi.user_rating_count:
-        parts.append(f"<user_rating_count>{poi.user_rating_count or '정보없음'}</user_rating_count>")
 
-    # 가격대
-    if poi.price_level:
-        parts.append(f"<price_level>{poi.price_level or '정보없음'} / {poi.price_range or '정보없음'}</price_level>")
+def _price_text(poi: PoiData) -> Optional[str]:
+    if not poi.price_level:
+        return None
+    return f"{poi.price_level} / {poi.price_range or '정보없음'}"
 
-    # editorial_summary
-    if poi.editorial_summary:
-        parts.append(f"<editorial_summary>{poi.editorial_summary or '정보없음'}</editorial_summary>")
 
-    # generative_summary
-    if poi.generative_summary:
-        parts.append(f"<generative_summary>{poi.generative_summary or '정보없음'}</generative_summary>")
-
-    # review_summary
-    if poi.review_summary:
-        parts.append(f"<review_summary>{poi.review_summary or '정보없음'}</review_summary>")
-    return "\n".join(parts)
+# ============================================================
+# R6: XML로 구조화된 내용
+# ============================================================
+@register_formatter("R6_XML로구조화된내용", description="XML로 구조화된 내용")
+def xml_structured_content_formatter(poi: PoiData, **kwargs) -> str:
+    types = poi.types
+    return _xml_elements({
+        "name": poi.name,
+        "primary_type": poi.primary_type,
+        "type": ", ".join(types) if types else None,
+        "address": poi.address,
+        "google_rating": poi.google_rating,
+        "user_rating_count": poi.user_rating_count,
+        "price_level": _price_text(poi),
+        "editorial_summary": poi.editorial_summary,
+        "generative_summary": poi.generative_summary,
+        "review_summary": poi.review_summary,
+    })
 
 
 # ============================================================
@@ -288,31 +343,12 @@ def xml_structured_content_formatter(poi: PoiData, **kwargs) -> str:
 # ============================================================
 @register_formatter("R7_간단한XML로구조화된내용", description="간단한 XML로 구조화된 내용")
 def simple_xml_structured_content_formatter(poi: PoiData, **kwargs) -> str:
-    parts = []
-
-    # 장소명
-    if poi.name:
-        parts.append(f"<name>{poi.name}</name>")
-
-    # 타입
-    if poi.types:
-        parts.append(f"<type>{', '.join(poi.types)}</type>")
-
-    # 가격대
-    if poi.price_level:
-        parts.append(f"<price_level>{poi.price_level or '정보없음'} / {poi.price_range or '정보없음'}</price_level>")
-
-    # editorial_summary
-    if poi.editorial_summary:
-        parts.append(f"<editorial_summary>{poi.editorial_summary or '정보없음'}</editorial_summary>")
-
-    # generative_summary
-    if poi.generative_summary:
-        parts.append(f"<generative_summary>{poi.generative_summary or '정보없음'}</generative_summary>")
-
-    # review_summary
-    if poi.review_summary:
-        parts.append(f"<review_summary>{poi.review_summary or '정보없음'}</review_summary>")
-    return "\n".join(parts)
-
-
+    types = poi.types
+    return _xml_elements({
+        "name": poi.name,
+        "type": ", ".join(types) if types else None,
+        "price_level": _price_text(poi),
+        "editorial_summary": poi.editorial_summary,
+        "generative_summary": poi.generative_summary,
+        "review_summary": poi.review_summary,
+    })
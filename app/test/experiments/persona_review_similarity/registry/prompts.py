@@ -6,6 +6,7 @@ Updated to match TravelPersonaAgent structure:
 - QAItem: id, question, answer
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Any
 
@@ -37,26 +38,31 @@ def register_prompt(name: str, description: str = ""):
     return decorator
 
 
+# (필드명, 리스트 여부) - TravelPersonaAgent와 같은 순서
+_ITINERARY_FIELDS = (
+    ("travelCity", False),
+    ("totalBudget", False),
+    ("travelTheme", True),
+    ("wantedPlace", True),
+    ("arrivalDate", False),
+    ("departureDate", False),
+)
+_MISSING = object()
+
+
 def _format_itinerary_request(itinerary_request: Any) -> str:
     """Format ItineraryRequest to XML string (matching TravelPersonaAgent)."""
     if itinerary_request is None:
         return ""
 
     lines = []
-    if hasattr(itinerary_request, 'travelCity'):
-        lines.append(f"    <travelCity>{itinerary_request.travelCity}</travelCity>")
-    if hasattr(itinerary_request, 'totalBudget'):
-        lines.append(f"    <totalBudget>{itinerary_request.totalBudget}</totalBudget>")
-    if hasattr(itinerary_request, 'travelTheme'):
-        themes = ", ".join(itinerary_request.travelTheme) if itinerary_request.travelTheme else ""
-        lines.append(f"    <travelTheme>{themes}</travelTheme>")
-    if hasattr(itinerary_request, 'wantedPlace'):
-        places = ", ".join(itinerary_request.wantedPlace) if itinerary_request.wantedPlace else ""
-        lines.append(f"    <wantedPlace>{places}</wantedPlace>")
-    if hasattr(itinerary_request, 'arrivalDate'):
-        lines.append(f"    <arrivalDate>{itinerary_request.arrivalDate}</arrivalDate>")
-    if hasattr(itinerary_request, 'departureDate'):
-        lines.append(f"    <departureDate>{itinerary_request.departureDate}</departureDate>")
+    for field, is_list in _ITINERARY_FIELDS:
+        value = getattr(itinerary_request, field, _MISSING)
+        if value is _MISSING:
+            continue
+        if is_list:
+            value = ", ".join(value) if value else ""
+        lines.append(f"    <{field}>{value}</{field}>")
 
     return "\n".join(lines)
 
@@ -288,19 +294,10 @@ def list_prompts() -> List[str]:
 # ============================================================
 # P5: XML로 구조화된 형태로 페르소나 표현
 # ============================================================
-@register_prompt("P5_XML로구조화된형태", description="XML로 구조화된 형태로 페르소나 표현")
-def xml_structured_persona_prompt(
-    itinerary_request: ItineraryRequest,
-    qa_items: List[QAItem] = [],
-) -> str:
-    """
-    Prompt optimized for embedding similarity with POI reviews.
-    Uses similar vocabulary and sentence structure as Google reviews.
-    """
-    pre_survey = _format_itinerary_request(itinerary_request)
-    qa_answers = _format_qa_items(qa_items)
-
-    return f"""당신은 “사용자 여행 취향 프로필 XML 생성기”입니다.
+# 고정 지시문은 [INPUT] 앞에 그대로 두어 매 호출 바이트 단위로 같은 prefix가 되게 함
+# (vLLM prefix caching / Anthropic cache_control / OpenAI 자동 캐싱이 이 prefix를 재사용).
+# 동적인 부분은 <trip_input> 블록뿐이므로 이 앞에는 아무것도 끼워 넣지 말 것.
+_P5_STATIC_PREFIX = """당신은 “사용자 여행 취향 프로필 XML 생성기”입니다.
 입력으로는 오직 아래 3가지 정보만 주어집니다:
 1) 여행지
 2) 여행 테마
@@ -319,15 +316,8 @@ def xml_structured_persona_prompt(
 - 임베딩 매칭을 위해, 아래 필드들에는 “쉼표로 구체 키워드 나열”을 적극 사용.
 
 [INPUT]
-<trip_input>
-  <destination>{itinerary_request.travelCity}</destination>
-  <theme>{itinerary_request.travelTheme}</theme>
-  <flight>
-    <outbound>{itinerary_request.departureDate}</outbound>
-    <inbound>{itinerary_request.arrivalDate}</inbound>
-  </flight>
-</trip_input>
-
+"""
+_P5_STATIC_SUFFIX = """
 [OUTPUT SCHEMA]
 <final_response>
   <!-- POI의 primary_type/type과 가까운 “선호 카테고리/장소 유형”을 만들어낸다 -->
@@ -374,6 +364,40 @@ def xml_structured_persona_prompt(
 
 이제 위 규칙대로, 반드시 XML만 출력하라."""
 
+
+@functools.lru_cache(maxsize=1024)
+def _render_p5_prompt(destination: str, theme: str, outbound: str, inbound: str) -> str:
+    """P5 프롬프트 본문 (같은 여행 조건이면 캐시된 문자열 재사용)"""
+    return "".join((
+        _P5_STATIC_PREFIX,
+        "<trip_input>\n",
+        "  <destination>", destination, "</destination>\n",
+        "  <theme>", theme, "</theme>\n",
+        "  <flight>\n",
+        "    <outbound>", outbound, "</outbound>\n",
+        "    <inbound>", inbound, "</inbound>\n",
+        "  </flight>\n",
+        "</trip_input>\n",
+        _P5_STATIC_SUFFIX,
+    ))
+
+
+@register_prompt("P5_XML로구조화된형태", description="XML로 구조화된 형태로 페르소나 표현")
+def xml_structured_persona_prompt(
+    itinerary_request: ItineraryRequest,
+    qa_items: List[QAItem] = [],
+) -> str:
+    """
+    Prompt optimized for embedding similarity with POI reviews.
+    Uses similar vocabulary and sentence structure as Google reviews.
+    """
+    return _render_p5_prompt(
+        str(itinerary_request.travelCity),
+        str(itinerary_request.travelTheme),
+        str(itinerary_request.departureDate),
+        str(itinerary_request.arrivalDate),
+    )
+
 # ============================================================
 # P6: 키워드 기반으로 페르소나 표현
 # ============================================================
@@ -14,6 +14,9 @@ Usage:
 
     # Override data paths
     python run_experiment.py --personas data/personas/new_data.json
+
+    # Cap LLM requests and score combinations in parallel
+    python run_experiment.py --max-concurrency 16 --parallel 4
 """
 
 import argparse
@@ -25,10 +28,6 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.test.experiments.persona_review_similarity.core.experiment_runner import (
-    ExperimentRunner,
-    ExperimentConfig,
-)
 from app.test.experiments.persona_review_similarity.registry.prompts import list_prompts
 from app.test.experiments.persona_review_similarity.registry.formatters import list_formatters
 from app.test.experiments.persona_review_similarity.registry.embedders import list_embedders
@@ -107,6 +106,33 @@ Examples:
         help="Experiment name (overrides config)",
     )
 
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Disable the on-disk embedding cache",
+    )
+
+    parser.add_argument(
+        "--embedding-cache-dtype",
+        choices=["float32", "float16"],
+        default=None,
+        help="Storage precision of the on-disk embedding cache (default: float32)",
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of LLM requests in flight (default: unbounded)",
+    )
+
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Number of embedders / combinations to process at the same time (default: 1)",
+    )
+
     parser.add_argument(
         "--list-variables",
         action="store_true",
@@ -167,6 +193,12 @@ def main() -> int:
 
     logger.info(f"Loading config from: {config_path}")
 
+    # Imported here so --help / --list-variables skip the runner, numba and the LLM client
+    from app.test.experiments.persona_review_similarity.core.experiment_runner import (
+        ExperimentRunner,
+        ExperimentConfig,
+    )
+
     # Load config
     config = ExperimentConfig.from_yaml(str(config_path))
 
@@ -187,6 +219,14 @@ def main() -> int:
         config.output_dir = args.output
     if args.name:
         config.name = args.name
+    if args.no_embedding_cache:
+        config.use_embedding_cache = False
+    if args.embedding_cache_dtype:
+        config.embedding_cache_dtype = args.embedding_cache_dtype
+    if args.max_concurrency:
+        config.max_concurrency = args.max_concurrency
+    if args.parallel:
+        config.parallel = args.parallel
 
     # Calculate total combinations
     total = len(config.prompts) * len(config.formatters) * len(config.embedders)
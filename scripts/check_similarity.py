@@ -1,7 +1,7 @@
 """
 벡터 DB의 모든 데이터에 대해 입력 텍스트와의 유사도를 확인하는 스크립트
 
-collection.get()으로 전체 데이터를 가져온 뒤 직접 유사도를 계산하여
+collection.get()으로 전체 데이터를 페이지 단위로 가져와 직접 유사도를 계산하여
 HNSW 근사 검색에 의한 누락 없이 정확한 전체 비교를 수행합니다.
 
 사용법:
@@ -9,51 +9,174 @@ HNSW 근사 검색에 의한 누락 없이 정확한 전체 비교를 수행합
     python scripts/check_similarity.py "입력 텍스트" --city "오사카"
     python scripts/check_similarity.py "입력 텍스트" --top 20
     python scripts/check_similarity.py "입력 텍스트" --metric euclidean
+    python scripts/check_similarity.py --queries-file queries.txt --top 10
+    python scripts/check_similarity.py --repl
+    python scripts/check_similarity.py "입력 텍스트" --no-cache
 """
 import asyncio
 import argparse
+import hashlib
+import heapq
+import itertools
+import shelve
 import sys
 import os
-import math
+from operator import itemgetter
 from typing import Callable, List, Tuple
 
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:  # optional fast path
+    simsimd = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional fast path
+    njit = None
+
+try:
+    import uvloop
+except ImportError:  # optional fast path (Windows 등 미지원 환경)
+    uvloop = None
+
 # 프로젝트 루트를 PYTHONPATH에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import chromadb
-from chromadb.config import Settings
-
 from app.core.Agents.Poi.VectorDB.VectorSearchAgent import (
     VectorSearchAgent,
     DEFAULT_PERSIST_DIR,
 )
+from app.core.Agents.Poi.VectorDB.ChromaClient import get_collection
+from app.core.Agents.Poi.VectorDB.EmbeddingPipeline.BaseEmbeddingPipeline import EmbeddingTaskType
 from app.core.Agents.Poi.VectorDB.EmbeddingPipeline.EmbeddingPipeline import EmbeddingPipeline
 
 
+# 쿼리 임베딩 디스크 캐시 위치와 캐시 키에 들어가는 모델 이름 (EmbeddingPipeline 기본 모델)
+EMBEDDING_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "planit", "embcache")
+EMBEDDING_MODEL_NAME = "jhgan/ko-sroberta-multitask"
+
+# collection.get 한 번에 가져올 행 수 (페이지당 점수 행렬 크기 = PAGE_SIZE x 쿼리 수)
+PAGE_SIZE = 4096
+
+
+class CachedEmbeddingPipeline:
+    """EmbeddingPipeline 앞단의 쿼리 임베딩 캐시 (shelve, 텍스트가 정확히 같을 때만 적중)
+
+    모든 쿼리가 캐시에 있으면 모델을 아예 로드하지 않습니다.
+    """
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL_NAME, path: str = EMBEDDING_CACHE_PATH):
+        self.model_name = model_name
+        self.path = path
+        self._pipeline: EmbeddingPipeline | None = None
+
+    @property
+    def pipeline(self) -> EmbeddingPipeline:
+        """실제 임베딩 파이프라인 (첫 캐시 미스 때 로드)"""
+        if self._pipeline is None:
+            self._pipeline = EmbeddingPipeline(self.model_name)
+        return self._pipeline
+
+    def _key(self, text: str, task_type: EmbeddingTaskType) -> str:
+        raw = f"{self.model_name}\0{task_type.value}\0{text}".encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    async def embed(
+        self, texts: List[str], task_type: EmbeddingTaskType = EmbeddingTaskType.QUERY
+    ) -> List[List[float]]:
+        """캐시에 없는 텍스트만 한 번에 임베딩하고 저장"""
+        keys = [self._key(text, task_type) for text in texts]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with shelve.open(self.path) as cache:
+            found = {key: cache[key] for key in set(keys) if key in cache}
+            missing = {key: text for key, text in zip(keys, texts) if key not in found}
+            if missing:
+                embeddings = await self.pipeline.embed(list(missing.values()), task_type)
+                for key, embedding in zip(missing, embeddings):
+                    cache[key] = found[key] = embedding
+        return [found[key] for key in keys]
+
+    async def embed_query(self, query: str) -> List[float]:
+        """쿼리 하나 임베딩 (캐시 우선)"""
+        return (await self.embed([query], EmbeddingTaskType.QUERY))[0]
+
+
 # ============================================================
 # 유사도 계산 함수 (교체 가능)
-# 입력: (vec_a, vec_b) -> float (높을수록 유사)
+# 입력: (M [N, D], Q [K, D]) -> scores [N, K] (높을수록 유사)
 # ============================================================
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
+# numba 커널: 행마다 내적과 norm(또는 거리)을 한 번에 계산해 임시 배열 없이 out에 기록.
+# 메트릭별로 함수를 나눠 각각 단일 타입으로 특수화되도록 함.
+# 스크립트는 __main__/import 등 모듈 이름이 달라져 디스크 캐시(cache=True)가 깨지므로 쓰지 않음
+if njit is not None:
+    @njit(parallel=True, fastmath=True)
+    def _cosine_kernel(M, Q, q_norms, out):
+        for i in prange(M.shape[0]):
+            m_sq = 0.0
+            for d in range(M.shape[1]):
+                m_sq += M[i, d] * M[i, d]
+            m_norm = np.sqrt(m_sq)
+            for k in range(Q.shape[0]):
+                dot = 0.0
+                for d in range(M.shape[1]):
+                    dot += M[i, d] * Q[k, d]
+                denom = m_norm * q_norms[k]
+                out[i, k] = dot / denom if denom > 0 else 0.0
+
+    @njit(parallel=True, fastmath=True)
+    def _euclidean_kernel(M, Q, out):
+        for i in prange(M.shape[0]):
+            for k in range(Q.shape[0]):
+                dist_sq = 0.0
+                for d in range(M.shape[1]):
+                    diff = M[i, d] - Q[k, d]
+                    dist_sq += diff * diff
+                out[i, k] = 1.0 / (1.0 + np.sqrt(dist_sq))
+else:
+    _cosine_kernel = None
+    _euclidean_kernel = None
+
+
+def cosine_similarity(M: np.ndarray, Q: np.ndarray) -> np.ndarray:
     """코사인 유사도 (ChromaDB 기본 메트릭과 동일)"""
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
-
-
-def dot_product_similarity(a: List[float], b: List[float]) -> float:
+    if simsimd is not None:
+        distances = np.asarray(simsimd.cdist(Q, M, metric="cosine"), dtype=np.float32)
+        return 1.0 - distances.T
+    if _cosine_kernel is not None:
+        out = np.empty((len(M), len(Q)), dtype=np.float32)
+        _cosine_kernel(
+            np.ascontiguousarray(M), np.ascontiguousarray(Q), np.linalg.norm(Q, axis=1), out
+        )
+        return out
+    dots = M @ Q.T
+    norms = np.outer(np.linalg.norm(M, axis=1), np.linalg.norm(Q, axis=1))
+    # 영벡터는 0.0
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def normalized_cosine_similarity(M: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    """행이 이미 L2 정규화된 경우의 코사인 유사도 (행 norm 계산 없이 내적 한 번)"""
+    q_norms = np.linalg.norm(Q, axis=1, keepdims=True)
+    Qn = np.divide(Q, q_norms, out=np.zeros_like(Q), where=q_norms > 0)
+    return M @ Qn.T
+
+
+def dot_product_similarity(M: np.ndarray, Q: np.ndarray) -> np.ndarray:
     """내적(dot product) 유사도"""
-    return sum(x * y for x, y in zip(a, b))
+    return M @ Q.T
 
 
-def euclidean_similarity(a: List[float], b: List[float]) -> float:
+def euclidean_similarity(M: np.ndarray, Q: np.ndarray) -> np.ndarray:
     """유클리드 거리 기반 유사도 (거리를 0~1 점수로 변환)"""
-    dist = math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
-    return 1.0 / (1.0 + dist)
+    if _euclidean_kernel is not None:
+        out = np.empty((len(M), len(Q)), dtype=np.float32)
+        _euclidean_kernel(np.ascontiguousarray(M), np.ascontiguousarray(Q), out)
+        return out
+    distances = np.stack([np.linalg.norm(M - q, axis=1) for q in Q], axis=1)
+    return 1.0 / (1.0 + distances)
 
 
 # 메트릭 이름 → 함수 매핑
@@ -64,39 +187,130 @@ SIMILARITY_METRICS: dict[str, Callable] = {
 }
 
 
-async def check_similarity(
-    query_text: str,
+def top_k_order(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 내림차순 상위 k개 인덱스 (동점은 앞선 인덱스 우선)
+
+    전체 정렬 O(N log N) 대신 partition O(N)으로 k번째 값을 찾고,
+    그 이상인 후보만 정렬합니다. 경계 동점까지 후보에 넣어 안정 정렬과 결과가 같습니다.
+    """
+    n = len(scores)
+    if k >= n:
+        return np.argsort(-scores, kind="stable")
+    kth_value = np.partition(scores, n - k)[n - k]
+    candidates = np.flatnonzero(scores >= kth_value)
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+
+
+class MetadataColumns:
+    """메타데이터를 열 단위 리스트로 보관 (행 dict 대신 정수 인덱스로 접근)"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.categories: List[str] = []
+        self.cities: List[str] = []
+        self.descriptions: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def extend(self, metadatas: List[dict]):
+        """행 dict 목록을 열에 추가 (빈 값은 출력용 기본값으로 한 번만 치환)"""
+        for metadata in metadatas:
+            self.names.append(metadata.get("name") or "(이름 없음)")
+            self.categories.append(metadata.get("category") or "-")
+            self.cities.append(metadata.get("city") or "-")
+            self.descriptions.append(metadata.get("description") or "-")
+
+
+# (컬렉션 id, 행 수) -> 읽어 둔 페이지 목록. 같은 프로세스의 반복 쿼리에서 재사용
+_page_cache: dict[tuple, list] = {}
+
+
+def load_pages(collection) -> List[Tuple[np.ndarray, List[dict], np.ndarray]]:
+    """컬렉션을 페이지 단위로 읽어 (임베딩, 메타데이터, 도시 배열) 목록으로 반환
+
+    행 수가 그대로면 이전에 읽은 결과를 그대로 돌려주어 REPL/배치에서 DB를 다시 읽지 않습니다.
+    """
+    key = (str(collection.id), collection.count())
+    pages = _page_cache.get(key)
+    if pages is not None:
+        return pages
+
+    pages = []
+    for offset in range(0, key[1], PAGE_SIZE):
+        page = collection.get(
+            offset=offset,
+            limit=PAGE_SIZE,
+            include=["embeddings", "metadatas"],
+        )
+        metadatas = page["metadatas"]
+        cities = np.array([metadata.get("city", "") for metadata in metadatas], dtype=object)
+        pages.append((np.asarray(page["embeddings"], dtype=np.float32), metadatas, cities))
+
+    # 마지막 컬렉션 상태 하나만 보관
+    _page_cache.clear()
+    _page_cache[key] = pages
+    return pages
+
+
+def rank_collection(
+    collection,
+    Q: np.ndarray,
+    similarity_fn: Callable,
     city_filter: str | None = None,
     top_k: int | None = None,
-    metric_name: str = "cosine",
-):
-    """벡터 DB 전체 데이터를 가져와 직접 유사도를 계산하여 출력"""
+) -> Tuple[List[List[Tuple[float, int]]], MetadataColumns]:
+    """컬렉션 전체를 페이지 단위로 훑어 쿼리별 (score, 행 번호) 순위 목록과 메타데이터 열을 반환
+
+    모든 쿼리를 페이지당 행렬곱 한 번으로 계산합니다 (페이지는 load_pages가 캐시).
+    행 번호는 columns의 인덱스이며, 도시 필터를 통과한 행만 열에 담깁니다.
+    """
+    ranked: List[List[Tuple[float, int]]] = [[] for _ in range(len(Q))]
+    columns = MetadataColumns()
+
+    for M, metadatas, cities in load_pages(collection):
+        # 도시 필터는 행렬 연산 전에 적용해 불필요한 계산을 건너뜀
+        if city_filter:
+            indices = np.flatnonzero(cities == city_filter)
+            M = M[indices]
+            metadatas = [metadatas[i] for i in indices]
+        if not len(M):
+            continue
 
-    similarity_fn = SIMILARITY_METRICS.get(metric_name)
-    if similarity_fn is None:
-        print(f"❌ 알 수 없는 메트릭: {metric_name}")
-        print(f"   사용 가능: {', '.join(SIMILARITY_METRICS.keys())}")
-        return
+        base = len(columns)
+        columns.extend(metadatas)
+        S = similarity_fn(M, Q)
 
-    # 1. 임베딩 파이프라인 초기화 & 쿼리 임베딩 생성
-    embedding_pipeline = EmbeddingPipeline()
-    query_embedding = await embedding_pipeline.embed_query(query_text)
+        for k, scores in enumerate(S.T):
+            # 페이지 안에서 정렬 (동점은 원래 순서 유지), top_k 밖의 행은 바로 버림
+            order = top_k_order(scores, top_k) if top_k else np.argsort(-scores, kind="stable")
+            page_items = list(zip(scores[order].tolist(), (order + base).tolist()))
 
-    # 2. ChromaDB에서 전체 데이터 직접 가져오기 (HNSW 우회)
-    client = chromadb.PersistentClient(
-        path=DEFAULT_PERSIST_DIR,
-        settings=Settings(anonymized_telemetry=False),
-    )
-    collection = client.get_collection("poi_embeddings")
-    total_count = collection.count()
+            if top_k:
+                # nlargest는 안정 정렬과 같아 앞 페이지 항목이 동점에서 앞섬
+                ranked[k] = heapq.nlargest(
+                    top_k, itertools.chain(ranked[k], page_items), key=itemgetter(0)
+                )
+            else:
+                ranked[k].extend(page_items)
 
-    if total_count == 0:
-        print("⚠️  벡터 DB에 저장된 데이터가 없습니다.")
-        return
+    # 유사도 순 정렬
+    if not top_k:
+        for scored_items in ranked:
+            scored_items.sort(key=itemgetter(0), reverse=True)
+    return ranked, columns
 
-    # 전체 데이터 조회 (임베딩 포함)
-    data = collection.get(include=["embeddings", "metadatas", "documents"])
 
+def print_report(
+    query_text: str,
+    scored_items: List[Tuple[float, int]],
+    columns: MetadataColumns,
+    total_count: int,
+    metric_name: str,
+    city_filter: str | None = None,
+    top_k: int | None = None,
+):
+    """쿼리 하나의 순위 표와 통계 요약 출력"""
     print(f"📦 벡터 DB 총 데이터 수: {total_count}개")
     print(f"🔍 검색 쿼리: \"{query_text}\"")
     print(f"📐 유사도 메트릭: {metric_name}")
@@ -104,46 +318,24 @@ async def check_similarity(
         print(f"🏙️  도시 필터: {city_filter}")
     print()
 
-    # 3. 전체 데이터에 대해 유사도 직접 계산
-    scored_items: List[Tuple[float, int]] = []  # (score, index)
-
-    for i, doc_id in enumerate(data["ids"]):
-        metadata = data["metadatas"][i]
-        embedding = data["embeddings"][i]
-
-        # 도시 필터 적용
-        if city_filter and metadata.get("city", "") != city_filter:
-            continue
-
-        if embedding is None:
-            continue
-
-        score = similarity_fn(query_embedding, embedding)
-        scored_items.append((score, i))
-
-    # 유사도 순 정렬
-    scored_items.sort(key=lambda x: x[0], reverse=True)
-
-    # top_k 적용
-    if top_k:
-        scored_items = scored_items[:top_k]
-
     if not scored_items:
         print("⚠️  검색 결과가 없습니다.")
         return
 
-    # 4. 결과 출력
+    # 결과 출력
     separator = "=" * 100
     print(separator)
     print(f"{'순위':>4}  {'유사도':>8}  {'카테고리':<12}  {'이름':<30}  {'도시':<10}  {'설명'}")
     print(separator)
 
-    for rank, (score, idx) in enumerate(scored_items, 1):
-        metadata = data["metadatas"][idx]
-        name = (metadata.get("name", "(이름 없음)") or "(이름 없음)")[:28]
-        category = (metadata.get("category", "-") or "-")[:10]
-        city = (metadata.get("city", "-") or "-")[:8]
-        desc_raw = metadata.get("description", "-") or "-"
+    names, categories, cities, descriptions = (
+        columns.names, columns.categories, columns.cities, columns.descriptions
+    )
+    for rank, (score, row) in enumerate(scored_items, 1):
+        name = names[row][:28]
+        category = categories[row][:10]
+        city = cities[row][:8]
+        desc_raw = descriptions[row]
         desc = (desc_raw[:40] + "...") if len(desc_raw) > 40 else desc_raw
 
         if score >= 0.7:
@@ -159,7 +351,7 @@ async def check_similarity(
 
     print(separator)
 
-    # 5. 통계 요약
+    # 통계 요약
     scores = [s for s, _ in scored_items]
     avg_score = sum(scores) / len(scores) if scores else 0
     high_count = sum(1 for s in scores if s >= 0.7)
@@ -174,9 +366,131 @@ async def check_similarity(
     print(f"   🔴 낮음 (<0.5): {low_count}개")
 
 
+def _open_collection():
+    """ChromaDB 컬렉션 열기 (HNSW 우회용 직접 조회, 프로세스 안에서 클라이언트 공유)"""
+    return get_collection("poi_embeddings", DEFAULT_PERSIST_DIR)
+
+
+async def _run_queries(
+    query_texts: List[str],
+    embedding_pipeline: EmbeddingPipeline | CachedEmbeddingPipeline,
+    collection,
+    city_filter: str | None,
+    top_k: int | None,
+    metric_name: str,
+):
+    """쿼리들을 한 번에 임베딩하고, 컬렉션을 한 번 훑어 쿼리별 결과 출력"""
+    total_count = collection.count()
+    if total_count == 0:
+        print("⚠️  벡터 DB에 저장된 데이터가 없습니다.")
+        return
+
+    similarity_fn = SIMILARITY_METRICS[metric_name]
+    # ip 컬렉션은 VectorSearchAgent가 L2 정규화된 임베딩만 저장하므로
+    # 코사인 = 내적 / ‖q‖ (행마다 norm을 다시 계산하지 않음)
+    if metric_name == "cosine" and (collection.metadata or {}).get("hnsw:space") == "ip":
+        similarity_fn = normalized_cosine_similarity
+
+    # 모든 쿼리를 forward pass 한 번으로 임베딩
+    query_embeddings = await embedding_pipeline.embed(query_texts, EmbeddingTaskType.QUERY)
+    Q = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_texts), -1)
+
+    ranked, columns = rank_collection(collection, Q, similarity_fn, city_filter, top_k)
+    for i, (query_text, scored_items) in enumerate(zip(query_texts, ranked)):
+        if i:
+            print()
+        print_report(query_text, scored_items, columns, total_count, metric_name, city_filter, top_k)
+
+
+def _check_metric(metric_name: str) -> bool:
+    if metric_name in SIMILARITY_METRICS:
+        return True
+    print(f"❌ 알 수 없는 메트릭: {metric_name}")
+    print(f"   사용 가능: {', '.join(SIMILARITY_METRICS.keys())}")
+    return False
+
+
+async def check_similarity(
+    query_text: str,
+    city_filter: str | None = None,
+    top_k: int | None = None,
+    metric_name: str = "cosine",
+    embedding_pipeline: EmbeddingPipeline | CachedEmbeddingPipeline | None = None,
+    collection=None,
+):
+    """벡터 DB 전체 데이터를 가져와 직접 유사도를 계산하여 출력
+
+    embedding_pipeline / collection을 넘기면 모델 로드와 DB 연결을 재사용합니다.
+    """
+    await check_similarity_batch(
+        [query_text], city_filter, top_k, metric_name, embedding_pipeline, collection
+    )
+
+
+async def check_similarity_batch(
+    query_texts: List[str],
+    city_filter: str | None = None,
+    top_k: int | None = None,
+    metric_name: str = "cosine",
+    embedding_pipeline: EmbeddingPipeline | CachedEmbeddingPipeline | None = None,
+    collection=None,
+):
+    """여러 쿼리를 배치 임베딩 한 번, 컬렉션 스캔 한 번으로 처리하여 출력"""
+    if not _check_metric(metric_name):
+        return
+
+    embedding_pipeline = embedding_pipeline or EmbeddingPipeline()
+    collection = collection or _open_collection()
+    await _run_queries(query_texts, embedding_pipeline, collection, city_filter, top_k, metric_name)
+
+
+async def repl(
+    city_filter: str | None = None,
+    top_k: int | None = None,
+    metric_name: str = "cosine",
+    embedding_pipeline: EmbeddingPipeline | CachedEmbeddingPipeline | None = None,
+    collection=None,
+):
+    """모델과 컬렉션을 한 번만 로드해 두고 입력받은 쿼리를 반복 처리 (빈 줄/EOF로 종료)"""
+    if not _check_metric(metric_name):
+        return
+
+    embedding_pipeline = embedding_pipeline or EmbeddingPipeline()
+    collection = collection or _open_collection()
+    while True:
+        try:
+            query_text = input("🔍 쿼리> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        if not query_text:
+            break
+        await _run_queries([query_text], embedding_pipeline, collection, city_filter, top_k, metric_name)
+        print()
+
+
+def _run(coro):
+    """uvloop이 있으면 uvloop 이벤트 루프로, 없으면 기본 루프로 코루틴 실행"""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
 def main():
     parser = argparse.ArgumentParser(description="벡터 DB 유사도 검색 도구")
-    parser.add_argument("query", type=str, help="유사도를 계산할 입력 텍스트")
+    parser.add_argument("query", type=str, nargs="?", help="유사도를 계산할 입력 텍스트")
+    parser.add_argument(
+        "--queries-file", type=str, default=None,
+        help="한 줄에 쿼리 하나씩 담긴 파일 (한 번에 배치 임베딩)",
+    )
+    parser.add_argument(
+        "--repl", action="store_true",
+        help="모델을 띄워 둔 채 쿼리를 반복 입력받는 대화형 모드",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"쿼리 임베딩 디스크 캐시({EMBEDDING_CACHE_PATH})를 쓰지 않고 항상 새로 계산",
+    )
     parser.add_argument("--city", type=str, default=None, help="도시 필터 (예: 오사카)")
     parser.add_argument("--top", type=int, default=None, help="상위 N개 결과 출력 (기본: 전체)")
     parser.add_argument(
@@ -188,8 +502,27 @@ def main():
     )
 
     args = parser.parse_args()
-    asyncio.run(check_similarity(args.query, args.city, args.top, args.metric))
 
+    query_texts = [args.query] if args.query else []
+    if args.queries_file:
+        with open(args.queries_file, encoding="utf-8") as f:
+            query_texts.extend(line.strip() for line in f if line.strip())
+    if not query_texts and not args.repl:
+        parser.error("query, --queries-file, --repl 중 하나가 필요합니다")
+
+    # 모델과 컬렉션은 여기서 한 번만 준비해 모든 쿼리가 공유
+    embedding_pipeline = (
+        EmbeddingPipeline(EMBEDDING_MODEL_NAME) if args.no_cache else CachedEmbeddingPipeline()
+    )
+    collection = _open_collection()
+
+    if args.repl:
+        _run(repl(args.city, args.top, args.metric, embedding_pipeline, collection))
+        return
+
+    _run(check_similarity_batch(
+        query_texts, args.city, args.top, args.metric, embedding_pipeline, collection
+    ))
 
 if __name__ == "__main__":
     main()
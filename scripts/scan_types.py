@@ -10,22 +10,32 @@ VectorDB에 저장된 POI들의 types 분석 스크립트
 
 import json
 import os
+import sqlite3
 import sys
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
-import chromadb
-from chromadb.config import Settings
+try:
+    import orjson
+except ImportError:  # optional fast path
+    orjson = None
+
+# types 필드(JSON 문자열 배열) 파서: orjson이 있으면 C 파서 사용
+_loads_types = orjson.loads if orjson is not None else json.loads
 
 # 프로젝트 루트를 PYTHONPATH에 추가
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from app.core.Agents.Poi.VectorDB.ChromaClient import get_client, get_collection
+
 # ======= 설정 =======
 VECTOR_DB_DIR = PROJECT_ROOT / "app" / "data" / "vector_db"
 COLLECTION_NAME = "poi_embeddings"
 OUTPUT_DIR = PROJECT_ROOT / "results"
 OUTPUT_FILE = OUTPUT_DIR / "type_analysis.json"
+BATCH_SIZE = 1000
 
 # 여행 추천에 부적합한 타입 (제외 대상)
 EXCLUDED_TYPES = {
@@ -40,6 +50,58 @@ EXCLUDED_TYPES = {
 }
 
 
+# Chroma 내부 SQLite 스키마 (chromadb 1.x): 컬렉션의 metadata 세그먼트 행으로 한정
+_COLLECTION_SCOPE_SQL = """
+    JOIN segments s ON s.id = e.segment_id
+    JOIN collections c ON c.id = s.collection
+    JOIN databases d ON d.id = c.database_id
+    WHERE d.name = 'default_database' AND c.name = ? AND s.scope = 'METADATA'
+"""
+_COUNT_SQL = "SELECT COUNT(*) FROM embeddings e" + _COLLECTION_SCOPE_SQL
+_TYPES_SQL = (
+    "SELECT e.embedding_id, em.string_value FROM embeddings e"
+    " JOIN embedding_metadata em ON em.id = e.id AND em.key = 'types'"
+    + _COLLECTION_SCOPE_SQL
+)
+
+
+def read_types_from_sqlite(
+    db_dir: Path, collection_name: str, expected_count: int
+) -> Optional[List[Tuple[str, str]]]:
+    """chroma.sqlite3에서 (poi_id, types 원문)만 SQL 한 번으로 읽기
+
+    Chroma의 메타데이터 객체 생성/직렬화를 건너뛰고 types 키만 가져옵니다.
+    types 키가 없는 POI는 결과에 포함되지 않습니다.
+    스키마가 다르거나 행 수가 collection.count()와 맞지 않으면 None을 반환합니다.
+    """
+    db_path = db_dir / "chroma.sqlite3"
+    if not db_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            (row_count,) = conn.execute(_COUNT_SQL, (collection_name,)).fetchone()
+            if row_count != expected_count:
+                return None
+            return conn.execute(_TYPES_SQL, (collection_name,)).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def read_types_from_collection(collection, total_count: int) -> Iterator[Tuple[str, str]]:
+    """collection.get을 배치로 돌며 (poi_id, types 원문) 생성 (SQLite 경로를 못 쓸 때)"""
+    for offset in range(0, total_count, BATCH_SIZE):
+        results = collection.get(
+            offset=offset,
+            limit=BATCH_SIZE,
+            include=["metadatas"]
+        )
+        for doc_id, metadata in zip(results["ids"], results["metadatas"]):
+            yield doc_id, metadata.get("types", "[]")
+
+
 def main():
     """메인 실행 함수"""
     print(f"VectorDB 경로: {VECTOR_DB_DIR}")
@@ -51,16 +113,11 @@ def main():
         print(f"❌ VectorDB 디렉토리가 존재하지 않습니다: {VECTOR_DB_DIR}")
         return
 
-    client = chromadb.PersistentClient(
-        path=str(VECTOR_DB_DIR),
-        settings=Settings(anonymized_telemetry=False)
-    )
-
     try:
-        collection = client.get_collection(name=COLLECTION_NAME)
+        collection = get_collection(COLLECTION_NAME, str(VECTOR_DB_DIR))
     except Exception as e:
         print(f"❌ 컬렉션을 찾을 수 없습니다: {e}")
-        print(f"존재하는 컬렉션: {[c.name for c in client.list_collections()]}")
+        print(f"존재하는 컬렉션: {[c.name for c in get_client(str(VECTOR_DB_DIR)).list_collections()]}")
         return
 
     total_count = collection.count()
@@ -71,38 +128,37 @@ def main():
         print("⚠️ 컬렉션에 데이터가 없습니다.")
         return
 
-    # 2. 모든 메타데이터 가져오기 (배치로)
-    BATCH_SIZE = 1000
+    # 2. 모든 POI의 types 가져오기 (SQLite 직접 조회, 불가하면 배치 collection.get)
     all_type_counter = Counter()       # type → 전체 빈도
-    type_to_pois = defaultdict(list)   # type → [poi_id, ...]
+    type_to_poi_count = Counter()      # type → 해당 타입이 붙은 POI 수 (id 목록은 보관하지 않음)
     poi_type_counts = []               # POI별 타입 수 리스트
     pois_without_types = 0
 
-    for offset in range(0, total_count, BATCH_SIZE):
-        results = collection.get(
-            offset=offset,
-            limit=BATCH_SIZE,
-            include=["metadatas"]
-        )
-        ids = results["ids"]
-        metadatas = results["metadatas"]
-
-        for doc_id, metadata in zip(ids, metadatas):
-            types_raw = metadata.get("types", "[]")
-            try:
-                types = json.loads(types_raw) if types_raw else []
-            except (json.JSONDecodeError, TypeError):
-                types = []
-
-            if not types:
-                pois_without_types += 1
-                poi_type_counts.append(0)
-                continue
-
-            poi_type_counts.append(len(types))
-            for t in types:
-                all_type_counter[t] += 1
-                type_to_pois[t].append(doc_id)
+    rows = read_types_from_sqlite(VECTOR_DB_DIR, COLLECTION_NAME, total_count)
+    if rows is None:
+        rows = read_types_from_collection(collection, total_count)
+
+    for doc_id, types_raw in rows:
+        try:
+            # orjson.JSONDecodeError도 json.JSONDecodeError의 하위 클래스
+            types = _loads_types(types_raw) if types_raw else []
+        except (json.JSONDecodeError, TypeError):
+            types = []
+
+        if not types:
+            pois_without_types += 1
+            poi_type_counts.append(0)
+            continue
+
+        poi_type_counts.append(len(types))
+        for t in types:
+            all_type_counter[t] += 1
+            type_to_poi_count[t] += 1
+
+    # types 키 자체가 없는 POI (SQLite 경로에서는 행이 오지 않음)
+    missing = total_count - len(poi_type_counts)
+    pois_without_types += missing
+    poi_type_counts.extend([0] * missing)
 
     # 3. 분석 결과 출력
     print(f"📊 타입 분석 결과")
@@ -119,30 +175,23 @@ def main():
         print(f"POI당 최대 타입 수: {max_types}")
         print()
 
-    # 여행 관련 vs 제외 타입 분류
+    # 여행 관련 vs 제외 타입 분류 (most_common 순서를 그대로 유지하므로 다시 정렬하지 않음)
+    all_types_frequency = dict(all_type_counter.most_common())
     travel_types = {}
     excluded_found = {}
-    for type_name, count in all_type_counter.most_common():
-        if type_name in EXCLUDED_TYPES:
-            excluded_found[type_name] = {
-                "count": count,
-                "poi_count": len(type_to_pois[type_name])
-            }
-        else:
-            travel_types[type_name] = {
-                "count": count,
-                "poi_count": len(type_to_pois[type_name])
-            }
+    for type_name, count in all_types_frequency.items():
+        target = excluded_found if type_name in EXCLUDED_TYPES else travel_types
+        target[type_name] = {"count": count, "poi_count": type_to_poi_count[type_name]}
 
     print(f"✅ 여행 관련 타입: {len(travel_types)}개")
     print("-" * 60)
-    for type_name, info in sorted(travel_types.items(), key=lambda x: -x[1]["count"]):
+    for type_name, info in travel_types.items():
         print(f"  {type_name:40s}  빈도: {info['count']:4d}  POI: {info['poi_count']:4d}개")
 
     print()
     print(f"❌ 제외 타입 (EXCLUDED_TYPES에 해당): {len(excluded_found)}개")
     print("-" * 60)
-    for type_name, info in sorted(excluded_found.items(), key=lambda x: -x[1]["count"]):
+    for type_name, info in excluded_found.items():
         print(f"  {type_name:40s}  빈도: {info['count']:4d}  POI: {info['poi_count']:4d}개")
 
     # 4. JSON 저장
@@ -155,18 +204,18 @@ def main():
             "excluded_types": len(excluded_found),
             "avg_types_per_poi": round(avg_types, 2) if poi_type_counts else 0,
         },
-        "travel_types": {
-            k: v for k, v in sorted(travel_types.items(), key=lambda x: -x[1]["count"])
-        },
-        "excluded_types_found": {
-            k: v for k, v in sorted(excluded_found.items(), key=lambda x: -x[1]["count"])
-        },
-        "all_types_frequency": dict(all_type_counter.most_common()),
+        "travel_types": travel_types,
+        "excluded_types_found": excluded_found,
+        "all_types_frequency": all_types_frequency,
     }
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson은 UTF-8 bytes를 바로 출력 (ensure_ascii=False, indent=2와 같은 결과)
+        OUTPUT_FILE.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
 
     print()
     print(f"💾 결과 저장: {OUTPUT_FILE}")